@@ -0,0 +1,26 @@
+"""
+Benchmarks for click-option-group
+
+The benchmarks use pytest-benchmark and are not collected by the default test run::
+
+    pip install -e .[benchmark]
+    pytest benchmarks --benchmark-autosave
+
+Saved results are stored in `.benchmarks/` and can be compared between commits::
+
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+from typing import Tuple
+
+import pytest
+from synthetic import SIZES
+
+
+def size_id(size: Tuple[int, int]) -> str:
+    return "{}x{}".format(*size)
+
+
+@pytest.fixture(params=SIZES, ids=size_id)
+def size(request) -> Tuple[int, int]:
+    return request.param
@@ -0,0 +1,168 @@
+"""Synthetic grouped commands for benchmarks"""
+
+from typing import Any, Callable, Dict, List, Optional, Type
+
+import click
+
+from click_option_group import (
+    AllOptionGroup,
+    AtLeast,
+    AtMost,
+    Implies,
+    MutuallyExclusiveOptionGroup,
+    OptionGroup,
+    RequiredAllOptionGroup,
+    RequiredAnyOptionGroup,
+    RequiredMutuallyExclusiveOptionGroup,
+    build_groups,
+    optgroup,
+)
+
+GROUP_CLASSES = (
+    RequiredAnyOptionGroup,
+    OptionGroup,
+    AllOptionGroup,
+    RequiredAllOptionGroup,
+    MutuallyExclusiveOptionGroup,
+    RequiredMutuallyExclusiveOptionGroup,
+)
+
+# (groups count, options per group)
+SIZES = [
+    (1, 1),
+    (1, 200),
+    (20, 20),
+    (100, 10),
+    (500, 2),
+]
+
+
+def option_name(group_index: int, option_index: int) -> str:
+    return f"--g{group_index}-o{option_index}"
+
+
+def make_command(
+    groups: int,
+    options: int,
+    command_cls: Type[click.Command] = click.Command,
+    params: Optional[List[click.Parameter]] = None,
+) -> click.Command:
+    """Builds a synthetic command with all kinds of option groups via `optgroup` decorators
+
+    The decorators add the parameters to `params` list if it is set.
+    """
+
+    def callback(**params):
+        pass
+
+    if params is not None:
+        callback.__click_params__ = params  # type: ignore[attr-defined]
+
+    func: Callable = callback
+
+    for group_index in reversed(range(groups)):
+        for option_index in reversed(range(options)):
+            func = optgroup.option(
+                option_name(group_index, option_index),
+                help=f"Option {option_index} of group {group_index}",
+            )(func)
+
+        cls = GROUP_CLASSES[group_index % len(GROUP_CLASSES)]
+        func = optgroup.group(f"Group {group_index}", cls=cls, help=f"{cls.__name__} {group_index}")(func)
+
+    return click.command("cli", cls=command_cls)(func)
+
+
+def make_spec(groups: int, options: int) -> List[Dict[str, Any]]:
+    """Builds the spec of the option groups of `make_command` for `build_groups`"""
+    spec = []
+
+    for group_index in range(groups):
+        cls = GROUP_CLASSES[group_index % len(GROUP_CLASSES)]
+        option_specs = [
+            {
+                "param_decls": [option_name(group_index, option_index)],
+                "help": f"Option {option_index} of group {group_index}",
+            }
+            for option_index in range(options)
+        ]
+        spec.append(
+            {
+                "name": f"Group {group_index}",
+                "cls": cls,
+                "help": f"{cls.__name__} {group_index}",
+                "options": option_specs,
+            }
+        )
+
+    return spec
+
+
+def make_built_command(spec: List[Dict[str, Any]]) -> click.Command:
+    """Builds a synthetic command from the spec with `build_groups`"""
+
+    def callback(**params):
+        pass
+
+    return click.command("cli")(build_groups(callback, spec))
+
+
+def make_plain_command(groups: int, options: int) -> click.Command:
+    """Builds a synthetic command with the same options as `make_command` without option groups"""
+
+    def callback(**params):
+        pass
+
+    func: Callable = callback
+
+    for group_index in reversed(range(groups)):
+        for option_index in reversed(range(options)):
+            func = click.option(
+                option_name(group_index, option_index),
+                help=f"Option {option_index} of group {group_index}",
+            )(func)
+
+    return click.command("cli")(func)
+
+
+def make_constrained_command(options: int) -> click.Command:
+    """Builds a synthetic command with one option group with declarative constraints"""
+
+    def callback(**params):
+        pass
+
+    func: Callable = callback
+
+    for option_index in reversed(range(options)):
+        func = optgroup.option(option_name(0, option_index))(func)
+
+    first, second = (option_name(0, index).lstrip("-").replace("-", "_") for index in range(2))
+    constraints = [AtLeast(1), AtMost(options // 2), Implies(first, second)]
+    func = optgroup.group("Group 0", constraints=constraints)(func)
+
+    return click.command("cli")(func)
+
+
+def make_argv(groups: int, options: int, *, valid: bool = True) -> List[str]:
+    """Builds the command line for the synthetic command
+
+    The invalid command line omits the options of every `RequiredAnyOptionGroup`.
+    """
+    argv = []
+
+    for group_index in range(groups):
+        cls = GROUP_CLASSES[group_index % len(GROUP_CLASSES)]
+
+        if cls is RequiredAnyOptionGroup:
+            option_indexes = range(1) if valid else range(0)
+        elif cls is RequiredAllOptionGroup:
+            option_indexes = range(options)
+        elif cls is RequiredMutuallyExclusiveOptionGroup:
+            option_indexes = range(1)
+        else:
+            option_indexes = range(0)
+
+        for option_index in option_indexes:
+            argv += [option_name(group_index, option_index), "value"]
+
+    return argv
@@ -0,0 +1,15 @@
+import click
+import pytest
+from synthetic import make_command
+
+from click_option_group import GroupedCommand
+
+
+@pytest.mark.parametrize("cls", [click.Command, GroupedCommand], ids=["click", "grouped"])
+def test_complete_options(benchmark, size, cls):
+    command = make_command(*size, command_cls=cls)
+    ctx = command.make_context("cli", [], resilient_parsing=True)
+
+    items = benchmark(command.shell_complete, ctx, "--g0-")
+
+    assert len(items) == size[1]
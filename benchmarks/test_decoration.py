@@ -0,0 +1,55 @@
+import pytest
+from synthetic import make_built_command, make_command, make_spec
+
+
+def test_decorate(benchmark, size):
+    command = benchmark(make_command, *size)
+    groups, options = size
+    assert len(command.params) == groups * (options + 1)
+
+
+def test_build_groups(benchmark, size):
+    spec = make_spec(*size)
+    command = benchmark(make_built_command, spec)
+    assert [param.opts for param in command.params] == [param.opts for param in make_command(*size).params]
+
+
+@pytest.mark.parametrize("options", [500, 1000, 2000, 5000])
+def test_decorate_large_group(benchmark, options):
+    command = benchmark.pedantic(make_command, args=(1, options), rounds=3)
+    if benchmark.stats is not None:
+        # The stats are missing with --benchmark-disable
+        benchmark.extra_info["us_per_option"] = benchmark.stats.stats.mean * 1e6 / options
+    assert len(command.params) == options + 1
+
+
+class ScanCountingList(list):
+    """The parameters list which counts the calls of the methods which scan the list"""
+
+    scans = 0
+
+    def index(self, *args):
+        self.scans += 1
+        return super().index(*args)
+
+    def remove(self, value):
+        self.scans += 1
+        super().remove(value)
+
+    def count(self, value):
+        self.scans += 1
+        return super().count(value)
+
+    def __contains__(self, value):
+        self.scans += 1
+        return super().__contains__(value)
+
+
+def test_decorate_large_group_list_scans():
+    def list_scans(options: int) -> int:
+        params = ScanCountingList()
+        make_command(1, options, params=params)
+        return params.scans
+
+    # The parameters list is not scanned per option, so the cost per option does not grow with the group size
+    assert list_scans(5000) == list_scans(500)
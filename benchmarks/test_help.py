@@ -0,0 +1,12 @@
+from synthetic import make_command
+
+
+def test_help(benchmark, size):
+    command = make_command(*size)
+
+    def get_help():
+        ctx = command.make_context("cli", ["--help"], resilient_parsing=True)
+        return command.get_help(ctx)
+
+    text = benchmark(get_help)
+    assert "Group 0:" in text
@@ -0,0 +1,31 @@
+import gc
+import tracemalloc
+
+from synthetic import make_command, make_plain_command
+
+
+def allocated_size(factory, *args) -> int:
+    """Returns the size of the memory blocks which are allocated by the factory and are still alive"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = factory(*args)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return size
+
+
+def test_memory_per_option(benchmark, size):
+    groups, options = size
+
+    def overhead_per_option() -> float:
+        grouped_size = allocated_size(make_command, groups, options)
+        plain_size = allocated_size(make_plain_command, groups, options)
+        return (grouped_size - plain_size) / (groups * options)
+
+    # The overhead is stored in "extra_info" of the saved results, e.g. `--benchmark-json`
+    overhead = benchmark.pedantic(overhead_per_option, rounds=3, warmup_rounds=1)
+    benchmark.extra_info["overhead_bytes_per_option"] = round(overhead)
@@ -0,0 +1,41 @@
+import click
+import pytest
+from synthetic import make_argv, make_command, make_constrained_command, option_name
+
+from click_option_group import GroupedCommand, validate_many
+
+command_classes = pytest.mark.parametrize("cls", [click.Command, GroupedCommand], ids=["click", "grouped"])
+
+
+@command_classes
+def test_parse_valid(benchmark, size, cls):
+    command = make_command(*size, command_cls=cls)
+    argv = make_argv(*size)
+
+    benchmark(command.main, argv, "cli", standalone_mode=False)
+
+
+@command_classes
+def test_parse_invalid(benchmark, size, cls):
+    command = make_command(*size, command_cls=cls)
+    argv = make_argv(*size, valid=False)
+
+    def main():
+        with pytest.raises(click.UsageError):
+            command.main(argv, "cli", standalone_mode=False)
+
+    benchmark(main)
+
+
+def test_parse_constraints(benchmark):
+    command = make_constrained_command(200)
+    argv = [arg for index in range(100) for arg in (option_name(0, index), "value")]
+
+    benchmark(command.main, argv, "cli", standalone_mode=False)
+
+
+def test_validate_many(benchmark, size):
+    command = make_command(*size)
+    argv_list = [make_argv(*size), make_argv(*size, valid=False)] * 50
+
+    benchmark(lambda: list(validate_many(command, argv_list)))
@@ -8,26 +8,113 @@ Option groups missing in Click
 :license: BSD, see LICENSE for more details.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from ._core import (
     AllOptionGroup,
     GroupedOption,
     MutuallyExclusiveOptionGroup,
     OptionGroup,
+    OptionGroupUsageError,
+    OptionGroupViolation,
     RequiredAllOptionGroup,
     RequiredAnyOptionGroup,
     RequiredMutuallyExclusiveOptionGroup,
 )
-from ._decorators import optgroup
+from ._decorators import EmptyOptionGroupWarning, optgroup
 from ._version import __version__
 
+if TYPE_CHECKING:
+    from ._batch import ValidationResult, validate_many
+    from ._builder import build_groups
+    from ._cache import dump_command, load_cached_command, load_command
+    from ._commands import GroupedCommand, GroupedGroup
+    from ._completion import complete_options
+    from ._constraints import AtLeast, AtMost, Constraint, Exactly, Implies
+    from ._daemon import CompletionDaemon, query_daemon
+    from ._instrument import InstrumentationEvent, add_instrumentation_hook, remove_instrumentation_hook
+    from ._lazy import LazyGroup, get_command_manifest
+    from ._manifest import export_manifest, is_manifest_current, load_manifest
+
 __all__ = [
     "__version__",
     "optgroup",
+    "EmptyOptionGroupWarning",
+    "build_groups",
+    "dump_command",
+    "load_command",
+    "load_cached_command",
+    "validate_many",
+    "ValidationResult",
+    "OptionGroupViolation",
+    "LazyGroup",
+    "get_command_manifest",
+    "export_manifest",
+    "load_manifest",
+    "is_manifest_current",
+    "GroupedCommand",
+    "GroupedGroup",
+    "complete_options",
+    "CompletionDaemon",
+    "query_daemon",
+    "InstrumentationEvent",
+    "add_instrumentation_hook",
+    "remove_instrumentation_hook",
     "GroupedOption",
     "OptionGroup",
+    "OptionGroupUsageError",
     "RequiredAnyOptionGroup",
     "AllOptionGroup",
     "RequiredAllOptionGroup",
     "MutuallyExclusiveOptionGroup",
     "RequiredMutuallyExclusiveOptionGroup",
+    "Constraint",
+    "AtMost",
+    "AtLeast",
+    "Exactly",
+    "Implies",
 ]
+
+# The modules which are not needed for decorating and parsing are imported on the first access
+_LAZY_EXPORTS = {
+    "ValidationResult": "._batch",
+    "validate_many": "._batch",
+    "build_groups": "._builder",
+    "dump_command": "._cache",
+    "load_cached_command": "._cache",
+    "load_command": "._cache",
+    "GroupedCommand": "._commands",
+    "GroupedGroup": "._commands",
+    "complete_options": "._completion",
+    "AtLeast": "._constraints",
+    "AtMost": "._constraints",
+    "Constraint": "._constraints",
+    "Exactly": "._constraints",
+    "Implies": "._constraints",
+    "CompletionDaemon": "._daemon",
+    "query_daemon": "._daemon",
+    "InstrumentationEvent": "._instrument",
+    "add_instrumentation_hook": "._instrument",
+    "remove_instrumentation_hook": "._instrument",
+    "LazyGroup": "._lazy",
+    "get_command_manifest": "._lazy",
+    "export_manifest": "._manifest",
+    "is_manifest_current": "._manifest",
+    "load_manifest": "._manifest",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
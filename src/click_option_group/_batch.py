@@ -0,0 +1,187 @@
+import collections
+import io
+import itertools
+from gettext import ngettext
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import click
+from click.core import iter_params_for_processing
+
+from ._core import OptionGroupViolation, _get_all_violations, _GroupTitleFakeOption
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# The missing value of click 8.2+, the older versions use None
+_UNSET = getattr(click.core, "UNSET", None)
+
+
+class ValidationResult(NamedTuple):
+    """The result of the validation of one command line
+
+    :param argv: the command line arguments
+    :param violations: the violations of the constraints of all option groups
+    :param error: the message of other usage error, e.g. for an unknown option, a missing required
+        parameter, an invalid value or an unexpected extra argument, or None
+    """
+
+    argv: Tuple[str, ...]
+    violations: Tuple[OptionGroupViolation, ...]
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        """Returns True if the command line is valid, so the command can be invoked with it"""
+        return not self.violations and self.error is None
+
+
+def validate_many(
+    command: click.Command,
+    argv_iter: Iterable[Sequence[str]],
+    *,
+    info_name: Optional[str] = None,
+    processes: Optional[int] = None,
+    chunksize: int = 256,
+) -> Iterator[ValidationResult]:
+    """Validates many command lines against the option groups of the command
+
+    The command lines are parsed by the command parser and the constraints of all
+    option groups are checked. The values are converted and the required parameters
+    and the extra arguments are checked like by the command, but the parameter callbacks
+    and the command callback are not called. The parser and the option groups index
+    are built once for all command lines.
+
+    The results are yielded in the order of the command lines. The violated constraints
+    of all option groups are reported as `OptionGroupViolation` records instead of raised errors.
+
+    :param command: the command with option groups
+    :param argv_iter: the iterable of the command line arguments lists
+    :param info_name: the command name for the error messages, the command name by default
+    :param processes: the number of worker processes. The command lines are validated
+        in the current process if it is not set. The command is passed to the workers
+        with `dump_command`
+    :param chunksize: the number of command lines which are sent to a worker process at once
+    :return: the iterator of `ValidationResult`
+    """
+    if processes is None:
+        validator = _BatchValidator(command, info_name)
+        return map(validator.validate, argv_iter)
+
+    if processes < 1:
+        msg = f"'processes' must be a positive integer, got {processes!r}."
+        raise ValueError(msg)
+
+    return _validate_in_processes(command, argv_iter, info_name, processes, chunksize)
+
+
+class _BatchValidator:
+    def __init__(self, command: click.Command, info_name: Optional[str]) -> None:
+        self._command = command
+        self._info_name = info_name or command.name
+        self._parser = command.make_parser(self._make_context())
+
+        self._params = tuple(param for param in command.params if not isinstance(param, _GroupTitleFakeOption))
+
+    def validate(self, argv: Sequence[str]) -> ValidationResult:
+        argv = tuple(argv)
+        violations, error, _ = self.validate_args(list(argv))
+        return ValidationResult(argv, violations, error)
+
+    def validate_args(self, args: List[str]) -> Tuple[Tuple[OptionGroupViolation, ...], Optional[str], List[str]]:
+        """Returns the violations, the usage error message and the arguments which are left after parsing"""
+        # The resilient context does not prompt for the missing values of the prompt options
+        ctx = self._make_context(resilient_parsing=True)
+
+        try:
+            opts, largs, order = self._parser.parse_args(args)
+        except click.UsageError as error:
+            return (), error.format_message(), []
+
+        violations = tuple(_get_all_violations(ctx, opts))
+
+        try:
+            self._check_params(ctx, opts, largs, order)
+        except click.UsageError as error:
+            return violations, error.format_message(), largs
+        finally:
+            # The converted values, e.g. the opened files, are closed
+            ctx.close()
+
+        return violations, None, largs
+
+    def _check_params(
+        self, ctx: click.Context, opts: Dict[str, Any], largs: List[str], order: List[click.Parameter]
+    ) -> None:
+        """Converts the parameter values and checks the required parameters and the extra arguments
+
+        The parameters are processed like by `click.Parameter.process_value` without calling the callbacks.
+        The values of the prompt options are not prompted, the missing values are checked as missing.
+        """
+        # The first failed parameter is the same as in the command, the given parameters are processed first
+        for param in iter_params_for_processing(order, self._params):
+            value, _ = param.consume_value(ctx, opts)
+            if value is not _UNSET:
+                value = param.type_cast_value(ctx, value)
+
+            if param.required and param.value_is_missing(value):
+                raise click.MissingParameter(ctx=ctx, param=param)
+
+        if largs and not ctx.allow_extra_args:
+            args = " ".join(largs)
+            msg = ngettext(
+                "Got unexpected extra argument ({args})", "Got unexpected extra arguments ({args})", len(largs)
+            )
+            raise click.UsageError(msg.format(args=args), ctx)
+
+    def _make_context(self, *, resilient_parsing: bool = False) -> click.Context:
+        return self._command.context_class(
+            self._command, info_name=self._info_name, resilient_parsing=resilient_parsing
+        )
+
+
+_worker_validator: Optional[_BatchValidator] = None
+
+
+def _init_worker(command_data: bytes, info_name: Optional[str]) -> None:
+    global _worker_validator  # noqa: PLW0603
+    from ._cache import load_command  # noqa: PLC0415 (deferred import)
+
+    command = load_command(io.BytesIO(command_data), check_sources=False)
+    _worker_validator = _BatchValidator(command, info_name)
+
+
+def _validate_chunk(chunk: List[Sequence[str]]) -> List[ValidationResult]:
+    return [_worker_validator.validate(argv) for argv in chunk]
+
+
+def _validate_in_processes(
+    command: click.Command,
+    argv_iter: Iterable[Sequence[str]],
+    info_name: Optional[str],
+    processes: int,
+    chunksize: int,
+) -> Iterator[ValidationResult]:
+    # The process pool and the serialization are imported only for the parallel validation
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415 (deferred import)
+
+    from ._cache import dump_command  # noqa: PLC0415 (deferred import)
+
+    command_data = io.BytesIO()
+    dump_command(command, command_data)
+
+    argv_iter = iter(argv_iter)
+    chunks = iter(lambda: list(itertools.islice(argv_iter, chunksize)), [])
+
+    with ProcessPoolExecutor(
+        processes, initializer=_init_worker, initargs=(command_data.getvalue(), info_name)
+    ) as executor:
+        # Keep a bounded number of chunks in flight, so the command lines are consumed lazily
+        pending: Deque[Future] = collections.deque()
+
+        for chunk in chunks:
+            pending.append(executor.submit(_validate_chunk, chunk))
+            if len(pending) >= processes * 2:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,90 @@
+from typing import Any, Iterable, Mapping, Optional, Type, Union
+
+import click
+
+from . import _core
+from ._core import FC, GroupedOption, OptionGroup, _GroupTitleFakeOption
+from ._decorators import optgroup
+from ._helpers import import_object
+
+GroupSpec = Mapping[str, Any]
+
+
+def build_groups(command_or_func: FC, spec: Iterable[GroupSpec]) -> FC:
+    """Adds the option groups described by the spec to the command or to the command function
+
+    The groups and the grouped options are created in one pass without the decorators bookkeeping.
+    The parameters are added in the same order as by `optgroup` decorators which are placed
+    above the existing decorators of the function, so the help output is the same.
+
+    Every group spec is a mapping with the items:
+        - "name": the group name
+        - "cls": the group class or its name, e.g. "RequiredAnyOptionGroup", or its import path
+          in "package.module:Class" format. `OptionGroup` by default
+        - "options": the list of option specs
+        - other items are passed to the group class, e.g. "help", "hidden" or "constraints"
+
+    Every option spec is a mapping with "param_decls" list, the other items are passed to the option
+    class like in `optgroup.option`, "cls" can also be the import path of the option class.
+
+    The example of usage::
+
+        build_groups(cli, [
+            {
+                "name": "Server",
+                "cls": "RequiredAllOptionGroup",
+                "options": [{"param_decls": ["--host"]}, {"param_decls": ["--port"], "type": int}],
+            },
+        ])
+
+    :param command_or_func: the command function or the command
+    :param spec: the list of group specs
+    :return: the command function or the command
+    """
+    # The parameters are added in the reversed order like by the decorators
+    for group_spec in reversed(list(spec)):
+        group_attrs = dict(group_spec)
+        name: Optional[str] = group_attrs.pop("name", None)
+        option_specs = list(group_attrs.pop("options", ()))
+        cls = _resolve_class(group_attrs.pop("cls", None) or OptionGroup, OptionGroup, "group")
+
+        if not option_specs:
+            with_name = f' "{name}"' if name else ""
+            message = f"The empty option group{with_name} was found in the spec. The group will not be added."
+            # The empty groups are reported like by the decorators, see `optgroup.empty_group_action`
+            optgroup._report_empty_group(message, stacklevel=2)
+            continue
+
+        try:
+            group = cls(name, **group_attrs)
+        except TypeError as err:
+            message = str(err).replace("__init__()", f"'{cls.__name__}' constructor")
+            raise TypeError(message) from err
+
+        for option_spec in reversed(option_specs):
+            option_attrs = dict(option_spec)
+            param_decls = option_attrs.pop("param_decls", ())
+            option_cls = _resolve_class(option_attrs.pop("cls", None) or GroupedOption, GroupedOption, "option")
+
+            if group._hidden:
+                option_attrs.setdefault("hidden", True)
+
+            click.option(*param_decls, cls=option_cls, group=group, **option_attrs)(command_or_func)
+
+        # The title option is above the group options
+        click.option(group._title_option_name, cls=_GroupTitleFakeOption, group=group)(command_or_func)
+
+    return command_or_func
+
+
+def _resolve_class(value: Union[str, type], base: type, kind: str) -> Type[Any]:
+    """Returns the class by the class, its name in the package or its import path"""
+    cls = value
+    if isinstance(value, str):
+        cls = import_object(value) if ":" in value else getattr(_core, value, None)
+
+    if not isinstance(cls, type) or not issubclass(cls, base):
+        msg = f"The {kind} class must be a subclass of '{base.__name__}' class, got {value!r}."
+        raise TypeError(msg)
+
+    return cls
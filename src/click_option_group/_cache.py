@@ -0,0 +1,237 @@
+import enum
+import io
+import os
+import pickle
+import sys
+import types
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+
+import click
+
+from ._core import _CommandIndex, _get_command_index
+from ._helpers import import_object, resolve_object
+
+CommandFactory = Union[str, Callable[[], click.Command]]
+FunctionReference = Tuple[str, str, bool]
+
+CACHE_FORMAT_VERSION = 2
+
+
+class _LazyFunction:
+    """The reference to a module level function which imports the module on the first call
+
+    The reference is used for the functions of the restored commands, so restoring a command
+    does not import (and decorate) the modules with the commands.
+
+    :param module: the module name
+    :param qualname: the qualified name of the function or the command in the module
+    :param command_callback: the reference is the callback of the command with qualified name
+    """
+
+    def __init__(self, module: str, qualname: str, command_callback: bool) -> None:
+        self._reference = (module, qualname, command_callback)
+        self._func: Optional[Callable] = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self._func is None:
+            self._func = _resolve_function(*self._reference)
+        return self._func(*args, **kwargs)
+
+    def __reduce__(self):
+        return type(self), self._reference
+
+    def __repr__(self) -> str:
+        module, qualname, _ = self._reference
+        return f"<{type(self).__name__} {module}:{qualname}>"
+
+
+class _CommandPickler(pickle.Pickler):
+    def __init__(self, file: IO[bytes]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.modules: Set[str] = set()
+
+    def persistent_id(self, obj: Any) -> Any:
+        if isinstance(obj, _CommandIndex):
+            # The index is rebuilt on the first use of the restored command
+            return ("index",)
+
+        if isinstance(obj, (type, types.FunctionType)):
+            self.modules.add(obj.__module__)
+
+        if isinstance(obj, types.FunctionType):
+            reference = _get_function_reference(obj)
+            if reference is not None:
+                return ("function", *reference)
+
+        if isinstance(obj, enum.Enum):
+            # Enum members are pickled by value by default, click uses enum members with object() values
+            enum_cls = type(obj)
+            self.modules.add(enum_cls.__module__)
+            return ("enum", enum_cls.__module__, enum_cls.__qualname__, obj.name)
+
+        return None
+
+
+class _CommandUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        kind, *reference = pid
+
+        if kind == "index":
+            return None
+        if kind == "enum":
+            module, qualname, name = reference
+            return resolve_object(module, qualname)[name]
+        if kind == "function":
+            module = reference[0]
+            if module in sys.modules:
+                try:
+                    return _resolve_function(*reference)
+                except AttributeError:
+                    # The module is being imported right now
+                    pass
+            return _LazyFunction(*reference)
+
+        msg = f"Unsupported persistent id: {pid!r}"
+        raise pickle.UnpicklingError(msg)
+
+
+def dump_command(command: click.Command, file: IO[bytes]) -> None:
+    """Serializes the fully decorated command to the binary file
+
+    The module level functions (e.g. the command callbacks) are stored as references
+    which import their modules only on the first call. The stored header contains the
+    state of the source files of all used modules, so `load_command` can check that
+    the serialized command is still current.
+
+    :param command: the command or the group of commands
+    :param file: the binary file object
+    """
+    for cmd in _iter_commands(command):
+        if getattr(cmd, "_help_option", None) is not None:
+            # The help option is created lazily and has a local function as a callback
+            cmd._help_option = None
+
+        # The flags of the callbacks are lost with the references to the callbacks,
+        # the index copies them to the command
+        _get_command_index(cmd)
+
+    payload = io.BytesIO()
+    pickler = _CommandPickler(payload)
+    pickler.dump(command)
+
+    module_files = (getattr(sys.modules.get(module), "__file__", None) for module in pickler.modules)
+
+    header = {
+        "format": CACHE_FORMAT_VERSION,
+        "python": sys.hexversion,
+        "sources": _get_sources_state(path for path in module_files if path),
+    }
+
+    pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+    file.write(payload.getvalue())
+
+
+def load_command(file: IO[bytes], *, check_sources: bool = True) -> Optional[click.Command]:
+    """Restores the command which was serialized by `dump_command`
+
+    :param file: the binary file object
+    :param check_sources: check that the source files of the used modules were not changed
+    :return: the restored command or None if the serialized command is outdated
+    """
+    header = pickle.load(file)
+
+    if header.get("format") != CACHE_FORMAT_VERSION or header.get("python") != sys.hexversion:
+        return None
+
+    if check_sources:
+        sources = header["sources"]
+        if _get_sources_state(sources) != sources:
+            return None
+
+    return _CommandUnpickler(file).load()
+
+
+def load_cached_command(cache_path: Union[str, "os.PathLike[str]"], factory: CommandFactory) -> click.Command:
+    """Returns the command restored from the cache file or creates and caches the command
+
+    The cache file is rewritten if it is missing, broken or outdated. The command which
+    cannot be serialized (e.g. it has an option with a lambda default) or written
+    (e.g. to a read-only directory) is not cached.
+
+    :param cache_path: the path to the cache file
+    :param factory: the function which returns the command or the import path
+        of the command in "package.module:attribute" format
+    :return: the command
+    """
+    cache_path = Path(cache_path)
+
+    try:
+        with cache_path.open("rb") as file:
+            command = load_command(file)
+    except Exception:
+        command = None
+
+    if command is not None:
+        return command
+
+    command = import_object(factory) if isinstance(factory, str) else factory()
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as file:
+            dump_command(command, file)
+        tmp_path.replace(cache_path)
+    except (OSError, pickle.PicklingError, AttributeError, TypeError):
+        # The cache only speeds up the startup, the command is used without the cache
+        pass
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    return command
+
+
+def _iter_commands(command: click.Command) -> Iterator[click.Command]:
+    yield command
+
+    for subcommand in getattr(command, "commands", {}).values():
+        yield from _iter_commands(subcommand)
+
+
+def _get_function_reference(func: types.FunctionType) -> Optional[FunctionReference]:
+    module_name = func.__module__
+    qualname = func.__qualname__
+
+    if "<locals>" in qualname or module_name not in sys.modules:
+        return None
+
+    obj: Any = sys.modules[module_name]
+    for name in qualname.split("."):
+        obj = getattr(obj, name, None)
+
+    if obj is func:
+        return module_name, qualname, False
+    if isinstance(obj, click.Command) and obj.callback is func:
+        return module_name, qualname, True
+
+    return None
+
+
+def _resolve_function(module: str, qualname: str, command_callback: bool) -> Callable:
+    obj = resolve_object(module, qualname)
+    return obj.callback if command_callback else obj
+
+
+def _get_sources_state(paths: Iterable[str]) -> Dict[str, Tuple[int, int]]:
+    state = {}
+
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            state[path] = (-1, -1)
+        else:
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+
+    return state
@@ -0,0 +1,105 @@
+from gettext import gettext as _
+from typing import Any, List, Tuple
+
+import click
+
+from ._completion import _uses_fast_completion, complete_options
+from ._core import _get_command_index, _GroupsValidationOption, _GroupTitleFakeOption
+
+_PARAMS_ATTR = "__click_option_groups_params__"
+
+
+class GroupedCommand(click.Command):
+    """The command class with the fast paths for option groups
+
+    The group title options do not take part in parsing. All option groups are validated once
+    after the other parameters are processed instead of while processing the grouped options.
+    The options are completed from the option groups index of the command (see `complete_options`).
+    """
+
+    __click_option_groups_command_validation__ = True
+
+    def get_params(self, ctx: click.Context) -> List[click.Parameter]:
+        return _get_parsed_params(self, ctx)
+
+    def format_options(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        _format_options(self, ctx, formatter)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> List[Any]:
+        if _uses_fast_completion(ctx, incomplete):
+            return complete_options(ctx, incomplete)
+        return super().shell_complete(ctx, incomplete)
+
+
+class GroupedGroup(click.Group):
+    """The group class with the fast paths for option groups
+
+    The group parses its options and validates its option groups like `GroupedCommand`.
+    The options are completed from the option groups index of the group (see `complete_options`).
+    The subcommands and the subgroups are created as `GroupedCommand` and `GroupedGroup` by default.
+    """
+
+    __click_option_groups_command_validation__ = True
+
+    command_class = GroupedCommand
+    group_class = type
+
+    def get_params(self, ctx: click.Context) -> List[click.Parameter]:
+        return _get_parsed_params(self, ctx)
+
+    def format_options(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        _format_options(self, ctx, formatter)
+        self.format_commands(ctx, formatter)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> List[Any]:
+        if _uses_fast_completion(ctx, incomplete):
+            from click.shell_completion import CompletionItem  # noqa: PLC0415 (click 8 only)
+
+            results = []
+            for name in self.list_commands(ctx):
+                if name.startswith(incomplete):
+                    cmd = self.get_command(ctx, name)
+                    if cmd is not None and not cmd.hidden:
+                        results.append(CompletionItem(name, help=cmd.get_short_help_str()))
+
+            results.extend(complete_options(ctx, incomplete))
+            return results
+
+        return super().shell_complete(ctx, incomplete)
+
+
+def _get_parsed_params(command: click.Command, ctx: click.Context) -> List[click.Parameter]:
+    """Returns the parameters without the group title options and with the groups validation option
+
+    The parameters are computed once per option groups index of the command.
+    """
+    index = _get_command_index(command)
+
+    cached = command.__dict__.get(_PARAMS_ATTR)
+    if cached is not None and cached[0] is index:
+        _, params, validation_option = cached
+    else:
+        params = tuple(param for param in command.params if not isinstance(param, _GroupTitleFakeOption))
+        validation_option = _GroupsValidationOption()
+        setattr(command, _PARAMS_ATTR, (index, params, validation_option))
+
+    help_option = command.get_help_option(ctx)
+    if help_option is not None:
+        return [*params, help_option, validation_option]
+    return [*params, validation_option]
+
+
+def _format_options(command: click.Command, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+    """Writes the options with the group titles into the formatter"""
+    help_option = command.get_help_option(ctx)
+    params: Tuple[click.Parameter, ...] = (*command.params, help_option) if help_option else tuple(command.params)
+
+    records = []
+    for param in params:
+        record = param.get_help_record(ctx)
+        if record is not None and not isinstance(param, click.Argument):
+            records.append(record)
+
+    if records:
+        with formatter.section(_("Options")):
+            formatter.write_dl(records)
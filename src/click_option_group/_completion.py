@@ -0,0 +1,91 @@
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+import click
+
+from ._core import GroupedOption, _get_command_index, _GroupTitleFakeOption
+
+_COMPLETIONS_ATTR = "__click_option_groups_completions__"
+
+
+class _CompletionEntry(NamedTuple):
+    name: str
+    param: click.Option
+    help: Optional[str]
+
+
+def complete_options(ctx: click.Context, incomplete: str) -> List[Any]:
+    """Returns the completions of the command options for the incomplete value
+
+    The options are enumerated once per option groups index of the command, the group
+    title options are skipped and the help records are not built. The grouped options
+    are described by their group names.
+
+    :param ctx: the invocation context of the command
+    :param incomplete: the incomplete value which starts with the option prefix, e.g. "--"
+    :return: the list of `click.shell_completion.CompletionItem`
+    """
+    from click.core import ParameterSource  # noqa: PLC0415 (click 8 only)
+    from click.shell_completion import CompletionItem  # noqa: PLC0415 (click 8 only)
+
+    entries = _get_completion_entries(ctx.command)
+
+    help_option = ctx.command.get_help_option(ctx)
+    if help_option is not None:
+        entries += _make_completion_entries(help_option)
+
+    results = []
+    for entry in entries:
+        if not entry.name.startswith(incomplete):
+            continue
+
+        param = entry.param
+        if not param.multiple and ctx.get_parameter_source(param.name) is ParameterSource.COMMANDLINE:
+            continue
+
+        results.append(CompletionItem(entry.name, help=entry.help))
+
+    return results
+
+
+def _uses_fast_completion(ctx: click.Context, incomplete: str) -> bool:
+    """Returns True if only the command options are completed for the incomplete value
+
+    The sibling commands of the chained groups are completed by click.
+    """
+    if not incomplete or incomplete[0].isalnum():
+        return False
+
+    parent = ctx.parent
+    while parent is not None:
+        if isinstance(parent.command, click.Group) and parent.command.chain:
+            return False
+        parent = parent.parent
+
+    return True
+
+
+def _get_completion_entries(command: click.Command) -> Tuple[_CompletionEntry, ...]:
+    index = _get_command_index(command)
+
+    cached = command.__dict__.get(_COMPLETIONS_ATTR)
+    if cached is not None and cached[0] is index:
+        return cached[1]
+
+    entries_list: List[_CompletionEntry] = []
+    # The options with the same name (e.g. the feature switches) are completed too
+    for param in command.params:
+        if isinstance(param, click.Option) and not isinstance(param, _GroupTitleFakeOption) and not param.hidden:
+            entries_list.extend(_make_completion_entries(param))
+
+    entries = tuple(entries_list)
+    setattr(command, _COMPLETIONS_ATTR, (index, entries))
+    return entries
+
+
+def _make_completion_entries(option: click.Option) -> Tuple[_CompletionEntry, ...]:
+    help_ = option.help
+
+    if isinstance(option, GroupedOption) and option.group.name:
+        help_ = f"{option.group.name}: {help_}" if help_ else option.group.name
+
+    return tuple(_CompletionEntry(name, option, help_) for name in (*option.opts, *option.secondary_opts))
@@ -0,0 +1,209 @@
+import abc
+from typing import Any, Mapping, NamedTuple, Sequence, Tuple
+
+import click
+
+from ._core import OptionGroup, OptionGroupViolation, _get_command_index
+
+
+class CompiledConstraint(NamedTuple):
+    """The constraint compiled for the options of one command
+
+    :param constraint: the declarative constraint
+    :param names: the names of the constrained options
+    :param bits: the bits of the constrained options in the same order as names
+    :param mask: the bitmask of all constrained options
+    """
+
+    constraint: "Constraint"
+    names: Tuple[str, ...]
+    bits: Tuple[int, ...]
+    mask: int
+
+
+def _count_bits(value: int) -> int:
+    return bin(value).count("1")
+
+
+class Constraint(abc.ABC):
+    """The base class for declarative constraints of option groups
+
+    The constraint is compiled once per command to the bitmasks of the constrained options
+    and it is checked against the bitmask of the options given in the command line.
+    The violation record is created only if the constraint is violated.
+
+    :param option_names: the names of the constrained options. The options of the group
+        are constrained if the names are not set. The names can refer to any options
+        of the command, e.g. to the options of other groups
+    """
+
+    kind = ""
+
+    def __init__(self, *option_names: str) -> None:
+        self.option_names = option_names
+
+    def __repr__(self) -> str:
+        args = ", ".join(repr(arg) for arg in self._repr_args())
+        return f"{type(self).__name__}({args})"
+
+    def compile(self, group_option_names: Sequence[str], bits: Mapping[str, int]) -> CompiledConstraint:
+        """Compiles the constraint for the options of a command
+
+        :param group_option_names: the names of the group options in the command
+        :param bits: the bits of all options of the command
+        :return: the compiled constraint
+        """
+        names = self.option_names or tuple(group_option_names)
+
+        for name in names:
+            if name not in bits:
+                msg = f"Unknown option '{name}' in {self!r} constraint."
+                raise TypeError(msg)
+
+        option_bits = tuple(bits[name] for name in names)
+        mask = 0
+        for bit in option_bits:
+            mask |= bit
+
+        return CompiledConstraint(self, names, option_bits, mask)
+
+    @abc.abstractmethod
+    def is_satisfied(self, compiled: CompiledConstraint, given: int) -> bool:
+        """Returns True if the constraint is satisfied
+
+        :param compiled: the constraint compiled for the command
+        :param given: the bitmask of the options given in the command line
+        """
+
+    def make_violation(
+        self,
+        group: OptionGroup,
+        compiled: CompiledConstraint,
+        given: int,
+        ctx: click.Context,
+    ) -> OptionGroupViolation:
+        """Returns the violation record for the violated constraint
+
+        :param group: the group of the constraint
+        :param compiled: the constraint compiled for the command
+        :param given: the bitmask of the options given in the command line
+        :param ctx: Click Context object
+        """
+        given_names = self._given_names(compiled, given)
+        missing_names = tuple(name for name in compiled.names if name not in given_names)
+        return OptionGroupViolation(group, compiled.names, self.kind, ctx, given=given_names, missing=missing_names)
+
+    def _repr_args(self) -> Tuple[Any, ...]:
+        return self.option_names
+
+    @staticmethod
+    def _given_names(compiled: CompiledConstraint, given: int) -> Tuple[str, ...]:
+        return tuple(name for name, bit in zip(compiled.names, compiled.bits) if given & bit)
+
+
+class _CountConstraint(Constraint):
+    def __init__(self, count: int, *option_names: str) -> None:
+        if count < 0:
+            msg = f"'count' must be a non-negative integer, got {count!r}."
+            raise ValueError(msg)
+
+        super().__init__(*option_names)
+        self.count = count
+
+    def make_violation(
+        self,
+        group: OptionGroup,
+        compiled: CompiledConstraint,
+        given: int,
+        ctx: click.Context,
+    ) -> OptionGroupViolation:
+        given_names = self._given_names(compiled, given)
+        details = {"count": self.count}
+
+        if len(given_names) > self.count:
+            return OptionGroupViolation(
+                group, given_names, self.kind, ctx, given=given_names, conflicting=given_names, details=details
+            )
+
+        missing_names = tuple(name for name in compiled.names if name not in given_names)
+        return OptionGroupViolation(
+            group, compiled.names, self.kind, ctx, given=given_names, missing=missing_names, details=details
+        )
+
+    def _repr_args(self) -> Tuple[Any, ...]:
+        return (self.count, *self.option_names)
+
+
+class AtMost(_CountConstraint):
+    """At most `count` of the options can be used at the same time
+
+    :param count: the maximal count of the given options
+    :param option_names: the names of the constrained options or the group options if not set
+    """
+
+    kind = "at_most"
+
+    def is_satisfied(self, compiled: CompiledConstraint, given: int) -> bool:
+        return _count_bits(given & compiled.mask) <= self.count
+
+
+class AtLeast(_CountConstraint):
+    """At least `count` of the options are required
+
+    :param count: the minimal count of the given options
+    :param option_names: the names of the constrained options or the group options if not set
+    """
+
+    kind = "at_least"
+
+    def is_satisfied(self, compiled: CompiledConstraint, given: int) -> bool:
+        return _count_bits(given & compiled.mask) >= self.count
+
+
+class Exactly(_CountConstraint):
+    """Exactly `count` of the options should be specified
+
+    :param count: the count of the given options
+    :param option_names: the names of the constrained options or the group options if not set
+    """
+
+    kind = "exactly"
+
+    def is_satisfied(self, compiled: CompiledConstraint, given: int) -> bool:
+        return _count_bits(given & compiled.mask) == self.count
+
+
+class Implies(Constraint):
+    """If the option is given, all required options should be given too
+
+    :param option_name: the name of the option which requires other options
+    :param required_names: the names of the required options
+    """
+
+    kind = "implies"
+
+    def __init__(self, option_name: str, *required_names: str) -> None:
+        if not required_names:
+            msg = "'Implies' constraint requires at least one required option name."
+            raise TypeError(msg)
+
+        super().__init__(option_name, *required_names)
+
+    def is_satisfied(self, compiled: CompiledConstraint, given: int) -> bool:
+        option_bit = compiled.bits[0]
+        required_mask = compiled.mask & ~option_bit
+        return not given & option_bit or given & required_mask == required_mask
+
+    def make_violation(
+        self,
+        group: OptionGroup,
+        compiled: CompiledConstraint,
+        given: int,
+        ctx: click.Context,
+    ) -> OptionGroupViolation:
+        given_names = self._given_names(compiled, given)
+        missing_names = tuple(name for name in compiled.names[1:] if name not in given_names)
+        option = _get_command_index(ctx.command).params[compiled.names[0]].get_error_hint(ctx)
+        return OptionGroupViolation(
+            group, missing_names, self.kind, ctx, given=given_names, missing=missing_names, details={"option": option}
+        )
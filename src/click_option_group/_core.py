@@ -1,12 +1,13 @@
-import collections
-import inspect
-import weakref
+import itertools
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
     Set,
@@ -17,15 +18,478 @@ from typing import (
 import click
 from click.core import augment_usage_errors
 
+if TYPE_CHECKING:
+    from ._constraints import Constraint
+
 from ._helpers import (
     get_callback_and_params,
-    get_fake_option_name,
     raise_mixing_decorators_error,
     resolve_wrappers,
 )
+from ._instrument import instrumented
 
 FC = Union[Callable, click.Command]
 
+_META_KEY = "click_option_group"
+_INDEX_ATTR = "__click_option_groups__"
+_COLLECT_ERRORS_ATTR = "__click_option_groups_collect_errors__"
+_TITLES_ATTR = "__click_option_group_titles__"
+_COMMAND_VALIDATION_ATTR = "__click_option_groups_command_validation__"
+
+_group_counter = itertools.count(1)
+
+
+HelpRecord = Optional[Tuple[str, str]]
+
+
+class _ContextState:
+    """The state of option groups for one context"""
+
+    __slots__ = ("collecting", "given", "given_opts", "help_indent", "help_records", "validated_groups")
+
+    def __init__(self) -> None:
+        self.validated_groups: Set[OptionGroup] = set()
+        self.collecting = False
+        self.given_opts: Optional[Mapping[str, Any]] = None
+        self.given = 0
+        self.help_records: Optional[Dict[click.Parameter, HelpRecord]] = None
+        self.help_indent: Optional[str] = None
+
+
+def _cleandoc(doc: str) -> str:
+    # `inspect` imports many modules, it is imported only for the groups with help
+    from inspect import cleandoc  # noqa: PLC0415 (deferred import)
+
+    return cleandoc(doc)
+
+
+def _get_context_state(ctx: click.Context) -> _ContextState:
+    """Returns the option groups state for the context
+
+    `ctx.meta` is shared between nested contexts, so the states are stored per context object.
+    """
+    states = ctx.meta.get(_META_KEY)
+    if states is None:
+        states = ctx.meta[_META_KEY] = {}
+
+    state = states.get(ctx)
+    if state is None:
+        state = states[ctx] = _ContextState()
+    return state
+
+
+class _GroupIndex(NamedTuple):
+    """Frozen snapshot of the options of one group attached to one command"""
+
+    names: Tuple[str, ...]
+    name_set: FrozenSet[str]
+    options: Tuple["GroupedOption", ...]
+    options_map: Dict[str, "GroupedOption"]
+    all_hidden: bool
+    bits: Tuple[int, ...]
+    mask: int
+
+
+class _CommandIndex(NamedTuple):
+    """Frozen snapshot of all option groups attached to a command
+
+    The snapshot is stored in the command and is rebuilt if the command parameters count changes.
+    Every named parameter gets a bit for the bitmask checks of the group options.
+    The snapshot also caches the help records for every help formatting setup and the flag
+    of the command function which enables collecting the violations of all groups.
+    """
+
+    param_count: int
+    groups: Dict["OptionGroup", _GroupIndex]
+    params: Dict[str, click.Parameter]
+    bits: Dict[str, int]
+    constraints: Dict["OptionGroup", Tuple[Any, ...]]
+    help_records: Dict[Tuple[Any, ...], Dict[click.Parameter, HelpRecord]]
+    collect_errors: bool
+
+
+_EMPTY_GROUP_INDEX = _GroupIndex((), frozenset(), (), {}, True, (), 0)
+
+
+def _build_command_index(command: click.Command) -> _CommandIndex:
+    group_options: Dict[OptionGroup, List[GroupedOption]] = {}
+    params: Dict[str, click.Parameter] = {}
+
+    for param in command.params:
+        if isinstance(param, GroupedOption):
+            group_options.setdefault(param.group, []).append(param)
+        if param.name and not isinstance(param, _GroupTitleFakeOption):
+            params.setdefault(param.name, param)
+
+    bits = {name: 1 << bit_index for bit_index, name in enumerate(params)}
+
+    groups = {}
+    for group, options in group_options.items():
+        names = tuple(opt.name for opt in options)
+        option_bits = tuple(bits.get(name, 0) for name in names)
+        mask = 0
+        for bit in option_bits:
+            mask |= bit
+
+        groups[group] = _GroupIndex(
+            names,
+            frozenset(names),
+            tuple(options),
+            # `get_options` keeps the order in which the decorators add the options (bottom to top)
+            dict(zip(reversed(names), reversed(options))),
+            all(opt.hidden for opt in options),
+            option_bits,
+            mask,
+        )
+
+    constraints = {
+        group: tuple(constraint.compile(group_index.names, bits) for constraint in group.constraints)
+        for group, group_index in groups.items()
+        if group.constraints
+    }
+
+    callback = command.callback
+    collect_errors = callback is not None and getattr(resolve_wrappers(callback), _COLLECT_ERRORS_ATTR, False)
+    if collect_errors:
+        # The flag of the command function is copied to the command, so the serialized command keeps it
+        setattr(command, _COLLECT_ERRORS_ATTR, True)
+
+    return _CommandIndex(len(command.params), groups, params, bits, constraints, {}, collect_errors)
+
+
+def _get_title_options(func: FC, callback: Optional[Callable]) -> Dict["OptionGroup", click.Option]:
+    """Returns the title options of the groups which are attached to the decorated function
+
+    The registry is stored in the object which owns the parameters list (the decorated function
+    or the command), so the groups do not keep the references to the decorated functions.
+    The command created from the decorated function takes the registry of its callback.
+    """
+    title_options = getattr(func, _TITLES_ATTR, None)
+    if title_options is None:
+        if isinstance(func, click.Command) and callback is not None:
+            title_options = getattr(callback, _TITLES_ATTR, None)
+        if title_options is None:
+            title_options = {}
+        setattr(func, _TITLES_ATTR, title_options)
+    return title_options
+
+
+def _get_command_index(command: click.Command) -> _CommandIndex:
+    index = command.__dict__.get(_INDEX_ATTR)
+    if index is None or index.param_count != len(command.params):
+        index = _build_command_index(command)
+        setattr(command, _INDEX_ATTR, index)
+    return index
+
+
+def _collects_errors(command: click.Command) -> bool:
+    """Returns True if the command reports the violations of all option groups together"""
+    return getattr(command, _COLLECT_ERRORS_ATTR, False) or _get_command_index(command).collect_errors
+
+
+def _overrides_handle_parse_result(group: "OptionGroup") -> bool:
+    """Returns True if the group class checks the options in its own `handle_parse_result` method"""
+    return type(group).handle_parse_result is not OptionGroup.handle_parse_result
+
+
+def _validate_all_groups(ctx: click.Context, opts: Mapping[str, Any]) -> None:
+    """Checks all option groups of the context command and raises one error with all violations"""
+    violations = _get_all_violations(ctx, opts)
+    if violations:
+        raise OptionGroupUsageError.from_violations(violations, ctx=ctx)
+
+
+def _get_all_violations(ctx: click.Context, opts: Mapping[str, Any]) -> List["OptionGroupViolation"]:
+    """Returns the violations of all option groups of the context command which were not validated yet"""
+    state = _get_context_state(ctx)
+    validated_groups = state.validated_groups
+    violations: List[OptionGroupViolation] = []
+
+    # The overridden `handle_parse_result` of a group can call the base method while collecting
+    state.collecting = True
+    try:
+        for group in _get_command_index(ctx.command).groups:
+            if group not in validated_groups:
+                violations.extend(group.get_violations(ctx, opts))
+                validated_groups.add(group)
+    finally:
+        state.collecting = False
+
+    return violations
+
+
+def _get_given_mask(ctx: click.Context, opts: Mapping[str, Any]) -> int:
+    """Returns the bitmask of the options given in the command line
+
+    The mask is computed once per context and parsed options.
+    """
+    state = _get_context_state(ctx)
+
+    if state.given_opts is not opts:
+        bits = _get_command_index(ctx.command).bits
+        given = 0
+        for name in opts:
+            given |= bits.get(name, 0)
+
+        state.given = given
+        state.given_opts = opts
+
+    return state.given
+
+
+def _split_given_names(index: _GroupIndex, given: int) -> Tuple[List[str], List[str]]:
+    """Returns the names of the given and not given options of the group"""
+    given_names: List[str] = []
+    missing_names: List[str] = []
+
+    for name, bit in zip(index.names, index.bits):
+        (given_names if given & bit else missing_names).append(name)
+
+    return given_names, missing_names
+
+
+def _get_help_records(ctx: click.Context) -> Dict[click.Parameter, HelpRecord]:
+    """Returns the help records cache for the context command and help formatting setup"""
+    state = _get_context_state(ctx)
+
+    if state.help_records is None:
+        if ctx.default_map:
+            # The help records can show the defaults from the context, do not share them
+            state.help_records = {}
+        else:
+            key = (
+                type(ctx),
+                getattr(ctx, "formatter_class", None),
+                ctx.terminal_width,
+                ctx.max_content_width,
+                getattr(ctx, "show_default", None),
+                ctx.auto_envvar_prefix,
+            )
+            state.help_records = _get_command_index(ctx.command).help_records.setdefault(key, {})
+
+    return state.help_records
+
+
+def _get_help_indent(ctx: click.Context) -> str:
+    state = _get_context_state(ctx)
+
+    if state.help_indent is None:
+        formatter = ctx.make_formatter()
+        with formatter.indentation():
+            state.help_indent = " " * formatter.current_indent
+
+    return state.help_indent
+
+
+_ERROR_MESSAGES = {
+    "required_any": "At least one of the following options from {group_name} option group is required:\n{option_info}",
+    "required_all": "Missing required options from {group_name} option group:\n{option_info}",
+    "mutually_exclusive": (
+        "Mutually exclusive options from {group_name} option group cannot be used at the same time:\n{option_info}"
+    ),
+    "required_mutually_exclusive": (
+        "Missing one of the required mutually exclusive options from {group_name} option group:\n{option_info}"
+    ),
+    "all_or_none": (
+        "All options from {group_name} option group should be specified or none should be specified. "
+        "Missing required options:\n{option_info}"
+    ),
+    "at_most": (
+        "At most {count} of the following options from {group_name} option group "
+        "can be used at the same time:\n{option_info}"
+    ),
+    "at_least": "At least {count} of the following options from {group_name} option group are required:\n{option_info}",
+    "exactly": (
+        "Exactly {count} of the following options from {group_name} option group should be specified:\n{option_info}"
+    ),
+    "implies": "Option {option} from {group_name} option group requires the following options:\n{option_info}",
+    "usage_error": "{message}",
+}
+
+
+def _get_options_error_hint(ctx: Optional[click.Context], group: "OptionGroup", option_names: Sequence[str]) -> str:
+    """Returns the error hint for the options of the group or any options of the command
+
+    The options are described by their names if the context is not set.
+    """
+    if ctx is None:
+        return "\n".join(f"  '{name}'" for name in option_names)
+
+    index = _get_command_index(ctx.command)
+    group_names = index.groups.get(group, _EMPTY_GROUP_INDEX).name_set
+
+    if group_names.issuperset(option_names):
+        return group.get_error_hint(ctx, set(option_names))
+
+    params = index.params
+    return "\n".join(f"  {params[name].get_error_hint(ctx)}" for name in option_names if name in params)
+
+
+class OptionGroupViolation:
+    """The violated constraint of an option group
+
+    The violation is a structured record of the error. The message is formatted only when it is requested.
+    The pickled violation keeps the formatted message but not the context and the parameters.
+
+    :param group: `OptionGroup` instance which constraint is violated
+    :param option_names: the names of the options which are reported in the error message
+    :param kind: the constraint kind, e.g. `required_any` or `mutually_exclusive`
+    :param ctx: Click Context object
+    :param given: the names of the constrained options which were given in the command line
+    :param missing: the names of the options which are missing
+    :param conflicting: the names of the given options which conflict with each other
+    :param details: the additional values for the error message of the constraint kind
+    """
+
+    def __init__(
+        self,
+        group: "OptionGroup",
+        option_names: Sequence[str],
+        kind: str,
+        ctx: Optional[click.Context] = None,
+        *,
+        given: Sequence[str] = (),
+        missing: Sequence[str] = (),
+        conflicting: Sequence[str] = (),
+        details: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.group = group
+        self.option_names = tuple(option_names)
+        self.kind = kind
+        self.ctx = ctx
+        self.given = tuple(given)
+        self.missing = tuple(missing)
+        self.conflicting = tuple(conflicting)
+        self.details = dict(details) if details else {}
+        self._message: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.kind} {self.group_name!r} {self.option_names}>"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_message"] = self.message
+        state["ctx"] = None
+        return state
+
+    @property
+    def group_name(self) -> str:
+        """Returns the option group name"""
+        return self.group.name
+
+    @property
+    def group_class(self) -> str:
+        """Returns the option group class name"""
+        return type(self.group).__name__
+
+    @property
+    def params(self) -> Tuple[click.Parameter, ...]:
+        """Returns the parameters of the reported options or empty tuple if the context is not set"""
+        if self.ctx is None:
+            return ()
+        params = _get_command_index(self.ctx.command).params
+        return tuple(params[name] for name in self.option_names if name in params)
+
+    @property
+    def message(self) -> str:
+        """Returns the error message"""
+        if self._message is None:
+            self._message = _ERROR_MESSAGES[self.kind].format(
+                group_name=self.group._group_name_str(),
+                option_info=_get_options_error_hint(self.ctx, self.group, self.option_names),
+                **self.details,
+            )
+        return self._message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the JSON compatible representation of the violation"""
+        return {
+            "group_name": self.group_name,
+            "group_class": self.group_class,
+            "kind": self.kind,
+            "option_names": list(self.option_names),
+            "given": list(self.given),
+            "missing": list(self.missing),
+            "conflicting": list(self.conflicting),
+            "message": self.message,
+        }
+
+
+class OptionGroupUsageError(click.UsageError):
+    """The usage error is raised if the constraints of option groups are violated
+
+    The error contains one or several `OptionGroupViolation` records. The error message
+    is formatted only when it is requested, e.g. by `format_message` or `str`.
+
+    :param group: `OptionGroup` instance which constraint is violated
+    :param option_names: the names of the options which are reported in the error message
+    :param kind: the constraint kind, e.g. `required_any` or `mutually_exclusive`
+    :param ctx: Click Context object
+    :param violation_attrs: the additional attributes of `OptionGroupViolation`
+    """
+
+    def __init__(
+        self,
+        group: "OptionGroup",
+        option_names: Sequence[str],
+        kind: str,
+        ctx: Optional[click.Context] = None,
+        **violation_attrs: Any,
+    ) -> None:
+        super().__init__("", ctx=ctx)
+        self.violations: Tuple[OptionGroupViolation, ...] = (
+            OptionGroupViolation(group, option_names, kind, ctx, **violation_attrs),
+        )
+        self._message: Optional[str] = None
+
+    @classmethod
+    def from_violations(
+        cls,
+        violations: Sequence[OptionGroupViolation],
+        ctx: Optional[click.Context] = None,
+    ) -> "OptionGroupUsageError":
+        """Creates the error for one or several violations
+
+        :param violations: the non-empty sequence of the violations
+        :param ctx: Click Context object
+        """
+        error = cls.__new__(cls)
+        click.UsageError.__init__(error, "", ctx=ctx)
+        error.violations = tuple(violations)
+        error._message = None
+        return error
+
+    @property
+    def violation(self) -> OptionGroupViolation:
+        """Returns the first violation"""
+        return self.violations[0]
+
+    @property
+    def group(self) -> "OptionGroup":
+        return self.violation.group
+
+    @property
+    def option_names(self) -> Tuple[str, ...]:
+        return self.violation.option_names
+
+    @property
+    def kind(self) -> str:
+        return self.violation.kind
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        return self.violation.details
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = "\n".join(violation.message for violation in self.violations)
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+
 
 class GroupedOption(click.Option):
     """Represents grouped (related) optional values
@@ -37,6 +501,8 @@ class GroupedOption(click.Option):
     :param attrs: additional option attributes
     """
 
+    __slots__ = ("__group",)
+
     def __init__(
         self,
         param_decls: Optional[Sequence[str]] = None,
@@ -67,27 +533,36 @@ class GroupedOption(click.Option):
         opts: Mapping[str, Any],
         args: List[str],
     ) -> Tuple[Any, List[str]]:
-        with augment_usage_errors(ctx, param=self):
-            if not ctx.resilient_parsing:
+        # The command validates all option groups after the other parameters (see `GroupedCommand`)
+        if not ctx.resilient_parsing and not getattr(ctx.command, _COMMAND_VALIDATION_ATTR, False):
+            with augment_usage_errors(ctx, param=self):
                 self.group.handle_parse_result(self, ctx, opts)
         return super().handle_parse_result(ctx, opts, args)
 
+    @instrumented("help_record", lambda option, *args: (option.group.name, type(option.group).__name__))
     def get_help_record(self, ctx: click.Context) -> Optional[Tuple[str, str]]:
+        help_records = _get_help_records(ctx)
+        if self in help_records:
+            return help_records[self]
+
         help_record = super().get_help_record(ctx)
-        if help_record is None:
-            # this happens if the option is hidden
-            return help_record
 
-        opts, opt_help = help_record
+        # help record is None if the option is hidden
+        if help_record is not None:
+            opts, opt_help = help_record
+            help_record = f"{_get_help_indent(ctx)}{opts}", opt_help
 
-        formatter = ctx.make_formatter()
-        with formatter.indentation():
-            indent = " " * formatter.current_indent
-            return f"{indent}{opts}", opt_help
+        help_records[self] = help_record
+        return help_record
 
 
 class _GroupTitleFakeOption(click.Option):
-    """The helper `Option` class to display option group title in help"""
+    """The helper `Option` class to display option group title in help
+
+    The option has no command line declarations and does not take part in parsing.
+    """
+
+    __slots__ = ("__group",)
 
     def __init__(
         self,
@@ -99,13 +574,62 @@ class _GroupTitleFakeOption(click.Option):
         self.__group = group
         super().__init__(param_decls, hidden=True, expose_value=False, help=group.help, **attrs)
 
-        # We remove parsed opts for the fake options just in case.
-        # For example it is workaround for correct click-repl autocomplete
-        self.opts = []
-        self.secondary_opts = []
+    @property
+    def group(self) -> "OptionGroup":
+        return self.__group
+
+    def _parse_decls(self, decls: Sequence[str], expose_value: bool) -> Tuple[Optional[str], List[str], List[str]]:
+        # The fake option has only a name. Empty opts is also a workaround for correct click-repl autocomplete
+        return decls[0], [], []
+
+    def add_to_parser(self, parser: Any, ctx: click.Context) -> None:
+        pass
+
+    def handle_parse_result(
+        self,
+        ctx: click.Context,
+        opts: Mapping[str, Any],
+        args: List[str],
+    ) -> Tuple[Any, List[str]]:
+        return None, args
 
     def get_help_record(self, ctx: click.Context) -> Optional[Tuple[str, str]]:
-        return self.__group.get_help_record(ctx)
+        help_records = _get_help_records(ctx)
+        if self not in help_records:
+            help_records[self] = self.__group.get_help_record(ctx)
+        return help_records[self]
+
+
+class _GroupsValidationOption(click.Option):
+    """The helper `Option` class to validate all option groups of the command at once
+
+    The option is the last parameter of `GroupedCommand` while parsing, so the groups are validated
+    after all other parameters. The option has no command line declarations.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(["_option_groups_validation"], hidden=True, expose_value=False)
+
+    def _parse_decls(self, decls: Sequence[str], expose_value: bool) -> Tuple[Optional[str], List[str], List[str]]:
+        return decls[0], [], []
+
+    def add_to_parser(self, parser: Any, ctx: click.Context) -> None:
+        pass
+
+    def handle_parse_result(
+        self,
+        ctx: click.Context,
+        opts: Mapping[str, Any],
+        args: List[str],
+    ) -> Tuple[Any, List[str]]:
+        if not ctx.resilient_parsing:
+            for group, group_index in _get_command_index(ctx.command).groups.items():
+                # The overridden methods can check the given option, so they are called for every option
+                options = group_index.options if _overrides_handle_parse_result(group) else group_index.options[:1]
+                for option in options:
+                    with augment_usage_errors(ctx, param=option):
+                        group.handle_parse_result(option, ctx, opts)
+        return None, args
 
 
 class OptionGroup:
@@ -116,21 +640,25 @@ class OptionGroup:
 
     :param name: the group name. If it is not set the default group name will be used
     :param help: the group help text or None
+    :param constraints: the declarative constraints for the options, e.g. `AtMost(2)` or `Implies("foo", "bar")`.
+        The constraints are checked after the group specific checks in `validate`
     """
 
+    __slots__ = ("__weakref__", "_constraints", "_help", "_hidden", "_name", "_title_option_name")
+
     def __init__(
         self,
         name: Optional[str] = None,
         *,
         hidden: bool = False,
         help: Optional[str] = None,
+        constraints: Sequence["Constraint"] = (),
     ) -> None:
         self._name = name if name else ""
-        self._help = inspect.cleandoc(help if help else "")
+        self._help = _cleandoc(help) if help else ""
         self._hidden = hidden
-
-        self._options: Mapping[Any, Any] = collections.defaultdict(weakref.WeakValueDictionary)
-        self._group_title_options = weakref.WeakValueDictionary()
+        self._constraints = tuple(constraints)
+        self._title_option_name = f"_option_group_title_{next(_group_counter)}"
 
     @property
     def name(self) -> str:
@@ -148,6 +676,11 @@ class OptionGroup:
         """
         return self._help
 
+    @property
+    def constraints(self) -> Tuple["Constraint", ...]:
+        """Returns the declarative constraints for the options"""
+        return self._constraints
+
     @property
     def name_extra(self) -> List[str]:
         """Returns extra name attributes for the group"""
@@ -158,13 +691,14 @@ class OptionGroup:
         """Returns the list of forbidden option attributes for the group"""
         return []
 
+    @instrumented("help_record")
     def get_help_record(self, ctx: click.Context) -> Optional[Tuple[str, str]]:
         """Returns the help record for the group
 
         :param ctx: Click Context object
         :return: the tuple of two fileds: `(name, help)`
         """
-        if all(o.hidden for o in self.get_options(ctx).values()):
+        if self._get_index(ctx).all_hidden:
             return None
 
         name = self.name
@@ -190,6 +724,7 @@ class OptionGroup:
         The decorator is used for adding options to the group and to the Click-command
         """
 
+        @instrumented("decorate_option", lambda func: (self.name, type(self).__name__))
         def decorator(func: FC) -> FC:
             option_attrs = attrs.copy()
             option_attrs.setdefault("cls", GroupedOption)
@@ -200,12 +735,15 @@ class OptionGroup:
                 msg = "'cls' argument must be a subclass of 'GroupedOption' class."
                 raise TypeError(msg)
 
-            self._check_mixing_decorators(func)
+            # The callback and the title options registry are resolved once per option
+            callback, params = get_callback_and_params(func)
+            title_options = _get_title_options(func, callback)
+
+            self._check_mixing_decorators(callback, params, title_options)
             func = click.option(*param_decls, group=self, **option_attrs)(func)
-            self._option_memo(func)
 
             # Add the fake invisible option to use for print nice title help for grouped options
-            self._add_title_fake_option(func)
+            self._add_title_fake_option(func, title_options)
 
             return func
 
@@ -213,63 +751,145 @@ class OptionGroup:
 
     def get_options(self, ctx: click.Context) -> Dict[str, GroupedOption]:
         """Returns the dictionary with group options"""
-        return self._options.get(resolve_wrappers(ctx.command.callback), {})
+        return self._get_index(ctx).options_map
 
     def get_option_names(self, ctx: click.Context) -> List[str]:
         """Returns the list with option names ordered by addition in the group"""
-        return list(reversed(list(self.get_options(ctx))))
+        return list(self._get_index(ctx).names)
 
+    @instrumented("error_hint")
     def get_error_hint(self, ctx: click.Context, option_names: Optional[Set[str]] = None) -> str:
-        options = self.get_options(ctx)
-        text = ""
+        options = self._get_index(ctx).options
 
-        for name, opt in reversed(list(options.items())):
-            if option_names and name not in option_names:
-                continue
-            text += f"  {opt.get_error_hint(ctx)}\n"
+        if option_names:
+            options = (opt for opt in options if opt.name in option_names)
 
-        if text:
-            text = text[:-1]
-
-        return text
+        return "\n".join(f"  {opt.get_error_hint(ctx)}" for opt in options)
 
     def handle_parse_result(self, option: GroupedOption, ctx: click.Context, opts: Mapping[str, Any]) -> None:
-        """The method should be used for adding specific behavior and relation for options in the group"""
+        """The method is called for every grouped option while parsing the command line
 
-    def _check_mixing_decorators(self, func: Callable) -> None:
-        func, params = get_callback_and_params(func)
+        `GroupedCommand` calls the method once per group with the first group option after all parameters are processed.
+        The overridden method is called for every option of the group.
 
-        if not params or func not in self._options:
+        The default implementation calls `validate` and checks the group constraints
+        exactly once per group and context. If the command collects errors (see `optgroup.collect_errors`),
+        all option groups of the command are checked at once and all violations are raised together.
+        """
+        state = _get_context_state(ctx)
+        validated_groups = state.validated_groups
+        if self in validated_groups:
             return
 
-        last_param = params[-1]
-        title_option = self._group_title_options[func]
-        options = self._options[func]
+        if not state.collecting and _collects_errors(ctx.command):
+            _validate_all_groups(ctx, opts)
+            return
+
+        self._validate_once(ctx, opts)
+        validated_groups.add(self)
+
+    def validate(self, ctx: click.Context, opts: Mapping[str, Any]) -> None:
+        """The method should be used for adding specific behavior and relation for options in the group
+
+        The method is called once per context with all options given in the command line.
+        The method should raise `OptionGroupUsageError` if the group constraint is violated.
+        """
+
+    @instrumented("validate")
+    def get_violations(self, ctx: click.Context, opts: Mapping[str, Any]) -> List[OptionGroupViolation]:
+        """Returns all violations of the group checks and the group constraints
+
+        Unlike `handle_parse_result`, the method does not stop on the first violated constraint.
+        The other usage errors of the group checks are reported as the violations of "usage_error" kind.
+        If the group class overrides `handle_parse_result`, the method is called for every option
+        of the group like while parsing and only its first error is reported.
+
+        :param ctx: Click Context object
+        :param opts: the options given in the command line
+        :return: the list of `OptionGroupViolation`
+        """
+        if _overrides_handle_parse_result(self):
+            return self._get_parse_result_violations(ctx, opts)
+
+        violations: List[OptionGroupViolation] = []
+
+        try:
+            self.validate(ctx, opts)
+        except click.UsageError as error:
+            violations.extend(self._get_error_violations(ctx, error))
+
+        compiled_constraints = _get_command_index(ctx.command).constraints.get(self, ())
+        if compiled_constraints:
+            given = _get_given_mask(ctx, opts)
+            violations.extend(
+                compiled.constraint.make_violation(self, compiled, given, ctx)
+                for compiled in compiled_constraints
+                if not compiled.constraint.is_satisfied(compiled, given)
+            )
+
+        return violations
 
-        if last_param.name != title_option.name and last_param.name not in options:
-            raise_mixing_decorators_error(last_param, func)
+    def _get_parse_result_violations(self, ctx: click.Context, opts: Mapping[str, Any]) -> List[OptionGroupViolation]:
+        for option in self._get_index(ctx).options:
+            try:
+                self.handle_parse_result(option, ctx, opts)
+            except click.UsageError as error:
+                return self._get_error_violations(ctx, error)
+        return []
+
+    def _get_error_violations(self, ctx: click.Context, error: click.UsageError) -> Tuple[OptionGroupViolation, ...]:
+        if isinstance(error, OptionGroupUsageError):
+            return error.violations
+
+        names = self._get_index(ctx).names
+        return (OptionGroupViolation(self, names, "usage_error", ctx, details={"message": error.format_message()}),)
+
+    @instrumented("validate")
+    def _validate_once(self, ctx: click.Context, opts: Mapping[str, Any]) -> None:
+        self.validate(ctx, opts)
+        self._check_constraints(ctx, opts)
+
+    def _check_constraints(self, ctx: click.Context, opts: Mapping[str, Any]) -> None:
+        compiled_constraints = _get_command_index(ctx.command).constraints.get(self)
+        if not compiled_constraints:
+            return
 
-    def _add_title_fake_option(self, func: FC) -> None:
-        callback, params = get_callback_and_params(func)
+        given = _get_given_mask(ctx, opts)
 
-        if callback not in self._group_title_options:
-            func = click.option(get_fake_option_name(), group=self, cls=_GroupTitleFakeOption)(func)
+        for compiled in compiled_constraints:
+            if not compiled.constraint.is_satisfied(compiled, given):
+                violation = compiled.constraint.make_violation(self, compiled, given, ctx)
+                raise OptionGroupUsageError.from_violations([violation], ctx=ctx)
+
+    def _get_index(self, ctx: click.Context) -> _GroupIndex:
+        return _get_command_index(ctx.command).groups.get(self, _EMPTY_GROUP_INDEX)
+
+    def _check_mixing_decorators(
+        self, callback: Callable, params: List[click.Parameter], title_options: Dict["OptionGroup", click.Option]
+    ) -> None:
+        if not params or self not in title_options:
+            return
+
+        last_param = params[-1]
 
-            _, params = get_callback_and_params(func)
-            self._group_title_options[callback] = params[-1]
+        # The options of the group and its title option are added one after another
+        if not isinstance(last_param, (GroupedOption, _GroupTitleFakeOption)) or last_param.group is not self:
+            raise_mixing_decorators_error(last_param, callback)
 
-        title_option = self._group_title_options[callback]
-        last_option = params[-1]
+    def _add_title_fake_option(self, func: FC, title_options: Dict["OptionGroup", click.Option]) -> None:
+        params = func.params if isinstance(func, click.Command) else func.__click_params__
 
-        if title_option.name != last_option.name:
-            # Hold title fake option on the top of the option group
-            title_index = params.index(title_option)
-            params[-1], params[title_index] = params[title_index], params[-1]
+        if self not in title_options:
+            # The title option is added after the first option of the group and stays on the top of it
+            click.option(self._title_option_name, group=self, cls=_GroupTitleFakeOption)(func)
+            title_options[self] = params[-1]
+            return
 
-    def _option_memo(self, func: Callable) -> None:
-        func, params = get_callback_and_params(func)
-        option = params[-1]
-        self._options[func][option.name] = option
+        # Hold title fake option on the top of the option group. The options of the group are added
+        # one after another, so the title option is just before the new option
+        title_option = title_options[self]
+        title_index = len(params) - 2 if params[-2] is title_option else params.index(title_option)
+        params[-1], params[title_index] = params[title_index], params[-1]
 
     def _group_name_str(self) -> str:
         return f"'{self.name}'" if self.name else "the"
@@ -281,6 +901,8 @@ class RequiredAnyOptionGroup(OptionGroup):
     `RequiredAnyOptionGroup` defines the behavior: At least one option from the group must be set.
     """
 
+    __slots__ = ()
+
     @property
     def forbidden_option_attrs(self) -> List[str]:
         return ["required"]
@@ -289,28 +911,20 @@ class RequiredAnyOptionGroup(OptionGroup):
     def name_extra(self) -> List[str]:
         return [*super().name_extra, "required_any"]
 
-    def handle_parse_result(self, option: GroupedOption, ctx: click.Context, opts: Mapping[str, Any]) -> None:
-        if option.name in opts:
+    def validate(self, ctx: click.Context, opts: Mapping[str, Any]) -> None:
+        index = self._get_index(ctx)
+
+        if _get_given_mask(ctx, opts) & index.mask:
             return
 
-        if all(o.hidden for o in self.get_options(ctx).values()):
+        if index.all_hidden:
             cls_name = self.__class__.__name__
             group_name = self._group_name_str()
 
             msg = f"Need at least one non-hidden option in {group_name} option group ({cls_name})."
             raise TypeError(msg)
 
-        option_names = set(self.get_options(ctx))
-
-        if not option_names.intersection(opts):
-            group_name = self._group_name_str()
-            option_info = self.get_error_hint(ctx)
-
-            msg = f"At least one of the following options from {group_name} option group is required:\n{option_info}"
-            raise click.UsageError(
-                msg,
-                ctx=ctx,
-            )
+        raise OptionGroupUsageError(self, index.names, "required_any", ctx=ctx, missing=index.names)
 
 
 class RequiredAllOptionGroup(OptionGroup):
@@ -319,6 +933,8 @@ class RequiredAllOptionGroup(OptionGroup):
     `RequiredAllOptionGroup` defines the behavior: All options from the group must be set.
     """
 
+    __slots__ = ()
+
     @property
     def forbidden_option_attrs(self) -> List[str]:
         return ["required", "hidden"]
@@ -327,18 +943,15 @@ class RequiredAllOptionGroup(OptionGroup):
     def name_extra(self) -> List[str]:
         return [*super().name_extra, "required_all"]
 
-    def handle_parse_result(self, option: GroupedOption, ctx: click.Context, opts: Mapping[str, Any]) -> None:
-        option_names = set(self.get_options(ctx))
+    def validate(self, ctx: click.Context, opts: Mapping[str, Any]) -> None:
+        index = self._get_index(ctx)
 
-        if not option_names.issubset(opts):
-            group_name = self._group_name_str()
-            required_names = option_names.difference(option_names.intersection(opts))
-            option_info = self.get_error_hint(ctx, required_names)
+        given = _get_given_mask(ctx, opts)
 
-            msg = f"Missing required options from {group_name} option group:\n{option_info}"
-            raise click.UsageError(
-                msg,
-                ctx=ctx,
+        if given & index.mask != index.mask:
+            given_names, required_names = _split_given_names(index, given)
+            raise OptionGroupUsageError(
+                self, required_names, "required_all", ctx=ctx, given=given_names, missing=required_names
             )
 
 
@@ -349,6 +962,8 @@ class MutuallyExclusiveOptionGroup(OptionGroup):
         - Only one or none option from the group must be set
     """
 
+    __slots__ = ()
+
     @property
     def forbidden_option_attrs(self) -> List[str]:
         return ["required"]
@@ -357,19 +972,15 @@ class MutuallyExclusiveOptionGroup(OptionGroup):
     def name_extra(self) -> List[str]:
         return [*super().name_extra, "mutually_exclusive"]
 
-    def handle_parse_result(self, option: GroupedOption, ctx: click.Context, opts: Mapping[str, Any]) -> None:
-        option_names = set(self.get_options(ctx))
-        given_option_names = option_names.intersection(opts)
-        given_option_count = len(given_option_names)
-
-        if given_option_count > 1:
-            group_name = self._group_name_str()
-            option_info = self.get_error_hint(ctx, given_option_names)
+    def validate(self, ctx: click.Context, opts: Mapping[str, Any]) -> None:
+        index = self._get_index(ctx)
+        given = _get_given_mask(ctx, opts) & index.mask
 
-            msg = f"Mutually exclusive options from {group_name} option group cannot be used at the same time:\n{option_info}"
-            raise click.UsageError(
-                msg,
-                ctx=ctx,
+        # More than one bit is set
+        if given & (given - 1):
+            given_names, _ = _split_given_names(index, given)
+            raise OptionGroupUsageError(
+                self, given_names, "mutually_exclusive", ctx=ctx, given=given_names, conflicting=given_names
             )
 
 
@@ -380,27 +991,19 @@ class RequiredMutuallyExclusiveOptionGroup(MutuallyExclusiveOptionGroup):
         - Only one required option from the group must be set
     """
 
+    __slots__ = ()
+
     @property
     def name_extra(self) -> List[str]:
         return [*super().name_extra, "required"]
 
-    def handle_parse_result(self, option: GroupedOption, ctx: click.Context, opts: Mapping[str, Any]) -> None:
-        super().handle_parse_result(option, ctx, opts)
-
-        option_names = set(self.get_option_names(ctx))
-        given_option_names = option_names.intersection(opts)
+    def validate(self, ctx: click.Context, opts: Mapping[str, Any]) -> None:
+        super().validate(ctx, opts)
 
-        if len(given_option_names) == 0:
-            group_name = self._group_name_str()
-            option_info = self.get_error_hint(ctx)
+        index = self._get_index(ctx)
 
-            msg = (
-                f"Missing one of the required mutually exclusive options from {group_name} option group:\n{option_info}"
-            )
-            raise click.UsageError(
-                msg,
-                ctx=ctx,
-            )
+        if not _get_given_mask(ctx, opts) & index.mask:
+            raise OptionGroupUsageError(self, index.names, "required_mutually_exclusive", ctx=ctx, missing=index.names)
 
 
 class AllOptionGroup(OptionGroup):
@@ -410,6 +1013,8 @@ class AllOptionGroup(OptionGroup):
         - All options from the group must be set or None must be set
     """
 
+    __slots__ = ()
+
     @property
     def forbidden_option_attrs(self) -> List[str]:
         return ["required", "hidden"]
@@ -418,15 +1023,13 @@ class AllOptionGroup(OptionGroup):
     def name_extra(self) -> List[str]:
         return [*super().name_extra, "all_or_none"]
 
-    def handle_parse_result(self, option: GroupedOption, ctx: click.Context, opts: Mapping[str, Any]) -> None:
-        option_names = set(self.get_options(ctx))
+    def validate(self, ctx: click.Context, opts: Mapping[str, Any]) -> None:
+        index = self._get_index(ctx)
 
-        if not option_names.isdisjoint(opts) and option_names.intersection(opts) != option_names:
-            group_name = self._group_name_str()
-            option_info = self.get_error_hint(ctx)
+        given = _get_given_mask(ctx, opts) & index.mask
 
-            msg = f"All options from {group_name} option group should be specified or none should be specified. Missing required options:\n{option_info}"
-            raise click.UsageError(
-                msg,
-                ctx=ctx,
+        if given and given != index.mask:
+            given_names, missing_names = _split_given_names(index, given)
+            raise OptionGroupUsageError(
+                self, index.names, "all_or_none", ctx=ctx, given=given_names, missing=missing_names
             )
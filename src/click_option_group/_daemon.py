@@ -0,0 +1,261 @@
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import click
+
+from ._batch import _BatchValidator
+from ._cache import CommandFactory, _get_sources_state, _iter_commands
+from ._helpers import import_object, resolve_wrappers
+from ._manifest import _add_command_modules, _get_module_file
+
+DaemonRequest = Dict[str, Any]
+DaemonResponse = Dict[str, Any]
+SocketPath = Union[str, "os.PathLike[str]"]
+
+
+class _LoadedCommand:
+    """The command with the state of its source files and the validators of its subcommands"""
+
+    def __init__(self, command: click.Command, sources: Dict[str, Tuple[int, int]]) -> None:
+        self.command = command
+        self.sources = sources
+        self.validators: Dict[click.Command, _BatchValidator] = {}
+
+
+class CompletionDaemon:
+    """The long-lived process which keeps the decorated command in memory
+
+    The daemon answers the shell completion and validation requests of the clients
+    over a Unix socket, so the command modules are not imported and decorated on every
+    completion. The requests and the responses are JSON objects, one object per line:
+
+    - ``{"action": "complete", "args": ["sub", "--foo", "1"], "incomplete": "--b"}`` returns
+      ``{"completions": [{"value": "--bar", "type": "plain", "help": "Group"}]}``
+    - ``{"action": "validate", "args": ["sub", "--foo", "1"]}`` returns
+      ``{"ok": true, "violations": [], "error": null}``. The violations of the option groups
+      of the command and its subcommands are in `OptionGroupViolation.to_dict` format
+
+    The invalid requests return ``{"failure": "message"}``. Every client connection
+    is handled in a separate thread and can send several requests.
+
+    The source files of the command modules are checked at most once per `check_interval`
+    seconds. The command is created again if they are changed.
+
+    The example of usage::
+
+        daemon = CompletionDaemon("mytool.cli:cli")
+        daemon.serve_forever("/run/user/1000/mytool.sock")
+
+    :param factory: the function which returns the command or the import path of the command
+        in "package.module:attribute" format
+    :param prog_name: the program name for the completion, the command name by default
+    :param check_interval: the minimal interval in seconds between the checks of the source files
+    """
+
+    def __init__(
+        self,
+        factory: CommandFactory,
+        *,
+        prog_name: Optional[str] = None,
+        check_interval: float = 1.0,
+    ) -> None:
+        self.factory = factory
+        self.prog_name = prog_name
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._server: Optional[socketserver.BaseServer] = None
+        self._checked = time.monotonic()
+        self._loaded = self._load()
+
+    @property
+    def command(self) -> click.Command:
+        """Returns the current command, the command is created again if its source files are changed"""
+        return self._get_loaded().command
+
+    def handle_request(self, request: DaemonRequest) -> DaemonResponse:
+        """Returns the response for the request
+
+        :param request: the request object with "action", "args" and "incomplete" items
+        :return: the response object
+        """
+        action = request.get("action")
+        args = request.get("args", [])
+
+        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+            msg = "'args' must be a list of strings."
+            raise ValueError(msg)
+
+        loaded = self._get_loaded()
+
+        if action == "complete":
+            return self._complete(loaded.command, args, str(request.get("incomplete", "")))
+        if action == "validate":
+            return self._validate(loaded, args)
+
+        msg = f"Unknown action {action!r}, expected 'complete' or 'validate'."
+        raise ValueError(msg)
+
+    def serve_forever(self, socket_path: SocketPath) -> None:
+        """Listens on the Unix socket and handles the requests until `shutdown` is called
+
+        A stale socket file is replaced. The socket file is removed on exit.
+
+        :param socket_path: the path of the Unix socket
+        """
+        path = Path(socket_path)
+        if path.exists() and stat.S_ISSOCK(path.stat().st_mode):
+            path.unlink()
+
+        server = socketserver.ThreadingUnixStreamServer(str(path), _DaemonRequestHandler)
+        server.daemon_threads = True
+        server.completion_daemon = self  # type: ignore[attr-defined]
+
+        self._server = server
+        try:
+            with server:
+                server.serve_forever()
+        finally:
+            self._server = None
+            path.unlink()
+
+    def shutdown(self) -> None:
+        """Stops `serve_forever` loop, it must be called from another thread"""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _complete(self, command: click.Command, args: List[str], incomplete: str) -> DaemonResponse:
+        from click.shell_completion import ShellComplete  # noqa: PLC0415 (click 8 only)
+
+        completion = ShellComplete(command, {}, self.prog_name or command.name, "")
+        items = completion.get_completions(args, incomplete)
+
+        return {"completions": [{"value": str(item.value), "type": item.type, "help": item.help} for item in items]}
+
+    def _validate(self, loaded: _LoadedCommand, args: List[str]) -> DaemonResponse:
+        command = loaded.command
+        info_name = self.prog_name or command.name
+        violations = []
+
+        while True:
+            validator = loaded.validators.get(command)
+            if validator is None:
+                validator = loaded.validators[command] = _BatchValidator(command, info_name)
+
+            command_violations, error, args = validator.validate_args(args)
+            violations.extend(command_violations)
+
+            if error is not None or not args or not isinstance(command, click.Group):
+                break
+
+            # The options of the subcommand are validated with the rest of the arguments
+            info_name, *args = args
+            subcommand = command.get_command(click.Context(command), info_name)
+            if subcommand is None:
+                error = f"No such command '{info_name}'."
+                break
+            command = subcommand
+
+        return {
+            "ok": not violations and error is None,
+            "violations": [violation.to_dict() for violation in violations],
+            "error": error,
+        }
+
+    def _get_loaded(self) -> _LoadedCommand:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked >= self.check_interval:
+                self._checked = now
+                self._loaded = self._reload_if_changed(self._loaded)
+            return self._loaded
+
+    def _load(self) -> _LoadedCommand:
+        command = import_object(self.factory) if isinstance(self.factory, str) else self.factory()
+        return _LoadedCommand(command, _get_sources_state(_get_command_files(command)[0]))
+
+    def _reload_if_changed(self, loaded: _LoadedCommand) -> _LoadedCommand:
+        # The lazily loaded subcommands add their files to the checked files
+        files, own_files = _get_command_files(loaded.command)
+        sources = _get_sources_state(files)
+
+        changed = {path for path, state in loaded.sources.items() if sources.get(path, state) != state}
+        if not changed:
+            loaded.sources = sources
+            return loaded
+
+        # The command modules are imported again, the changed modules of other packages too
+        if isinstance(self.factory, str):
+            own_files.add(_get_module_file(self.factory.partition(":")[0]))
+
+        reloaded_files = (changed | own_files) - {None}
+        for name, module in list(sys.modules.items()):
+            if getattr(module, "__file__", None) in reloaded_files:
+                del sys.modules[name]
+
+        return self._load()
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        daemon: CompletionDaemon = self.server.completion_daemon  # type: ignore[attr-defined]
+
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    msg = "The request must be a JSON object."
+                    raise ValueError(msg)
+                response = daemon.handle_request(request)
+            except Exception as error:
+                # The errors of the requests and the command reloading are reported to the client
+                response = {"failure": f"{type(error).__name__}: {error}"}
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+def query_daemon(socket_path: SocketPath, request: DaemonRequest, *, timeout: Optional[float] = 5.0) -> DaemonResponse:
+    """Sends the request to `CompletionDaemon` and returns its response
+
+    :param socket_path: the path of the daemon Unix socket
+    :param request: the request object
+    :param timeout: the timeout of the socket operations in seconds
+    :return: the response object
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+
+        with sock.makefile("rb") as file:
+            line = file.readline()
+
+    if not line:
+        msg = "The completion daemon closed the connection without a response."
+        raise ConnectionError(msg)
+
+    return json.loads(line)
+
+
+def _get_command_files(command: click.Command) -> Tuple[Set[str], Set[str]]:
+    """Returns the source files of all modules used by the command tree and the files of the callbacks"""
+    modules: Set[str] = set()
+    own_modules = set()
+
+    for cmd in _iter_commands(command):
+        _add_command_modules(cmd, modules)
+        if cmd.callback is not None:
+            own_modules.add(resolve_wrappers(cmd.callback).__module__)
+
+    files = {path for path in map(_get_module_file, modules) if path}
+    own_files = {path for path in map(_get_module_file, own_modules) if path}
+    return files, own_files
@@ -1,22 +1,30 @@
 import collections
-import inspect
+import sys
+import threading
 import warnings
 from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar
 
 import click
 
-from ._core import OptionGroup
+from ._core import _COLLECT_ERRORS_ATTR, OptionGroup
 from ._helpers import (
     get_callback_and_params,
     raise_mixing_decorators_error,
 )
+from ._instrument import instrumented
 
-T = TypeVar("T")
 F = TypeVar("F", bound=Callable)
 
 Decorator = Callable[[F], F]
 
 
+EMPTY_GROUP_ACTIONS = ("warn", "ignore", "collect")
+
+
+class EmptyOptionGroupWarning(RuntimeWarning):
+    """The warning is issued if an option group without grouped options was found"""
+
+
 class OptionStackItem(NamedTuple):
     param_decls: Tuple[str, ...]
     attrs: Dict[str, Any]
@@ -26,22 +34,45 @@ class OptionStackItem(NamedTuple):
 class _NotAttachedOption(click.Option):
     """The helper class to catch grouped options which were not attached to the group
 
-    Raises TypeError if not attached options exist.
+    The option is added once for a decorated function while its grouped options
+    are not attached to a group. Raises TypeError if not attached options exist.
     """
 
-    def __init__(self, param_decls=None, *, all_not_attached_options, **attrs):
-        super().__init__(param_decls, expose_value=False, hidden=False, is_eager=True, **attrs)
-        self._all_not_attached_options = all_not_attached_options
+    def __init__(self, param_decls=None, *, option_stack, **attrs):
+        super().__init__(param_decls, expose_value=False, hidden=True, is_eager=True, **attrs)
+        self._option_stack = option_stack
+
+    def _parse_decls(self, decls, expose_value):
+        return decls[0], [], []
+
+    def add_to_parser(self, parser, ctx):
+        # Not attached options still should be parsed to get to the error in handle_parse_result
+        for option in self._get_not_attached_options():
+            option.add_to_parser(parser, ctx)
 
     def handle_parse_result(self, ctx, opts, args):
         options_error_hint = ""
-        for option in reversed(self._all_not_attached_options[ctx.command.callback]):
+        for option in self._get_not_attached_options():
             options_error_hint += f"  {option.get_error_hint(ctx)}\n"
         options_error_hint = options_error_hint[:-1]
 
         msg = f"Missing option group decorator in '{ctx.command.name}' command for the following grouped options:\n{options_error_hint}\n"
         raise TypeError(msg)
 
+    def _get_not_attached_options(self) -> List[click.Option]:
+        return [click.Option(item.param_decls) for item in reversed(self._option_stack)]
+
+
+class _DecoratingState(threading.local):
+    """The decorating state of `_OptGroup`
+
+    The state is thread-local, so the commands can be decorated concurrently from different threads.
+    """
+
+    def __init__(self) -> None:
+        self.option_stacks: Dict[Callable, List[OptionStackItem]] = collections.defaultdict(list)
+        self.not_attached_options: Dict[Callable, click.Option] = {}
+
 
 class _OptGroup:
     """A helper class to manage creating groups and group options via decorators
@@ -59,12 +90,41 @@ class _OptGroup:
         @optgroup.group('Group 2', help='option group 2')
         @optgroup.option('--spam')
         ...
+
+    The empty option groups are reported according to `empty_group_action`:
+        - "warn" issues `EmptyOptionGroupWarning` immediately (default)
+        - "ignore" does not report empty groups
+        - "collect" stores the warnings, use `pop_empty_group_warnings` to get them
+
+    :param empty_group_action: the action for empty option groups
     """
 
-    def __init__(self) -> None:
-        self._decorating_state: Dict[Callable, List[OptionStackItem]] = collections.defaultdict(list)
-        self._not_attached_options: Dict[Callable, List[click.Option]] = collections.defaultdict(list)
-        self._outer_frame_index = 1
+    def __init__(self, *, empty_group_action: str = "warn") -> None:
+        self._decorating_state = _DecoratingState()
+        self._empty_group_warnings: List[warnings.WarningMessage] = []
+        self.empty_group_action = empty_group_action
+
+    @property
+    def empty_group_action(self) -> str:
+        """Returns the action for empty option groups: "warn", "ignore" or "collect" """
+        return self._empty_group_action
+
+    @empty_group_action.setter
+    def empty_group_action(self, action: str) -> None:
+        if action not in EMPTY_GROUP_ACTIONS:
+            msg = f"'empty_group_action' must be one of {EMPTY_GROUP_ACTIONS}, got {action!r}."
+            raise ValueError(msg)
+        self._empty_group_action = action
+
+    def pop_empty_group_warnings(self) -> List[warnings.WarningMessage]:
+        """Returns and clears the collected warnings about empty option groups
+
+        The warnings are collected if `empty_group_action` is "collect". The warnings
+        can be issued later by `warnings.showwarning`.
+        """
+        empty_group_warnings = self._empty_group_warnings
+        self._empty_group_warnings = []
+        return empty_group_warnings
 
     def __call__(
         self,
@@ -84,11 +144,7 @@ class _OptGroup:
         :param cls: Option group class that should be inherited from `OptionGroup` class
         :param attrs: Additional parameters of option group class
         """
-        try:
-            self._outer_frame_index = 2
-            return self.group(name, help=help, cls=cls, **attrs)
-        finally:
-            self._outer_frame_index = 1
+        return self.group(name, help=help, cls=cls, **attrs)
 
     def group(
         self,
@@ -115,28 +171,25 @@ class _OptGroup:
             msg = "'cls' must be a subclass of 'OptionGroup' class."
             raise TypeError(msg)
 
+        @instrumented("decorate_group", lambda func: (name or "", cls.__name__))
         def decorator(func: F) -> F:
             callback, params = get_callback_and_params(func)
+            state = self._decorating_state
 
-            if callback not in self._decorating_state:
-                frame = inspect.getouterframes(inspect.currentframe())[self._outer_frame_index]
-                lineno = frame.lineno
-
-                with_name = f' "{name}"' if name else ""
-                warnings.warn(
-                    (
-                        f"The empty option group{with_name} was found (line {lineno}) "
-                        f'for "{callback.__name__}". The group will not be added.'
-                    ),
-                    RuntimeWarning,
-                    stacklevel=2,
-                )
+            if callback not in state.option_stacks:
+                self._warn_empty_group(name, callback)
                 return func
 
-            option_stack = self._decorating_state.pop(callback)
+            option_stack = state.option_stacks.pop(callback)
 
-            [params.remove(opt) for opt in self._not_attached_options.pop(callback)]
-            self._check_mixing_decorators(callback, option_stack, self._filter_not_attached(params))
+            # The not attached option was added with the first grouped option at its position
+            not_attached_option = state.not_attached_options.pop(callback)
+            not_attached_index = option_stack[0].param_count
+            if not_attached_index < len(params) and params[not_attached_index] is not_attached_option:
+                del params[not_attached_index]
+            else:
+                params.remove(not_attached_option)
+            self._check_mixing_decorators(callback, option_stack, params, len(params))
 
             attrs["help"] = help
 
@@ -166,17 +219,38 @@ class _OptGroup:
         def decorator(func: F) -> F:
             callback, params = get_callback_and_params(func)
 
-            option_stack = self._decorating_state[callback]
-            params = self._filter_not_attached(params)
+            option_stack = self._decorating_state.option_stacks[callback]
 
-            self._check_mixing_decorators(callback, option_stack, params)
-            self._add_not_attached_option(func, param_decls)
-            option_stack.append(OptionStackItem(param_decls, attrs, len(params)))
+            if option_stack:
+                # Do not count the not attached option which was added with the first grouped option
+                param_count = len(params) - 1
+                self._check_mixing_decorators(callback, option_stack, params, param_count)
+            else:
+                param_count = len(params)
+                self._add_not_attached_option(func, callback, option_stack)
+
+            option_stack.append(OptionStackItem(param_decls, attrs, param_count))
 
             return func
 
         return decorator
 
+    def collect_errors(self) -> Decorator[F]:
+        """The decorator enables reporting the violations of all option groups of the command together
+
+        By default, the first violated option group stops the parsing. With this decorator,
+        all option groups are checked once after parsing and `OptionGroupUsageError` contains
+        the violations of all groups. The decorator can be applied to the command function
+        or to the command.
+        """
+
+        def decorator(func: F) -> F:
+            target = func if isinstance(func, click.Command) else get_callback_and_params(func)[0]
+            setattr(target, _COLLECT_ERRORS_ATTR, True)
+            return func
+
+        return decorator
+
     def help_option(self, *param_decls: str, **attrs: Any) -> Decorator[F]:
         """This decorator adds a help option to the group, which prints
         the command's help text and exits.
@@ -201,27 +275,54 @@ class _OptGroup:
 
         return self.option(*param_decls, **attrs)
 
-    def _add_not_attached_option(self, func, param_decls) -> None:
+    def _warn_empty_group(self, name: Optional[str], callback: Callable) -> None:
+        if self._empty_group_action == "ignore":
+            return
+
+        # The frame of the decorated function: _warn_empty_group <- decorator <- instrumented wrapper <- decorated function
+        frame = sys._getframe(3)
+
+        with_name = f' "{name}"' if name else ""
+        message = (
+            f"The empty option group{with_name} was found (line {frame.f_lineno}) "
+            f'for "{callback.__name__}". The group will not be added.'
+        )
+
+        self._report_empty_group(message, stacklevel=4)
+
+    def _report_empty_group(self, message: str, stacklevel: int) -> None:
+        """Reports the empty option group according to `empty_group_action`
+
+        :param message: the warning message
+        :param stacklevel: the stack level of the warning like in `warnings.warn` called by the caller
+        """
+        if self._empty_group_action == "ignore":
+            return
+
+        warning = EmptyOptionGroupWarning(message)
+
+        if self._empty_group_action == "collect":
+            frame = sys._getframe(stacklevel)
+            self._empty_group_warnings.append(
+                warnings.WarningMessage(warning, EmptyOptionGroupWarning, frame.f_code.co_filename, frame.f_lineno)
+            )
+        else:
+            warnings.warn(warning, stacklevel=stacklevel + 1)
+
+    def _add_not_attached_option(self, func, callback, option_stack) -> None:
         click.option(
-            *param_decls,
-            all_not_attached_options=self._not_attached_options,
+            "_not_attached_options",
+            option_stack=option_stack,
             cls=_NotAttachedOption,
         )(func)
 
-        callback, params = get_callback_and_params(func)
-        self._not_attached_options[callback].append(params[-1])
+        _, params = get_callback_and_params(func)
+        self._decorating_state.not_attached_options[callback] = params[-1]
 
     @staticmethod
-    def _filter_not_attached(options: List[T]) -> List[T]:
-        return [opt for opt in options if not isinstance(opt, _NotAttachedOption)]
-
-    @staticmethod
-    def _check_mixing_decorators(callback, options_stack, params):
-        if options_stack:
-            last_state = options_stack[-1]
-
-            if len(params) > last_state.param_count:
-                raise_mixing_decorators_error(params[-1], callback)
+    def _check_mixing_decorators(callback, options_stack, params, param_count):
+        if options_stack and param_count > options_stack[-1].param_count:
+            raise_mixing_decorators_error(params[-1], callback)
 
 
 optgroup = _OptGroup()
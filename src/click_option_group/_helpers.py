@@ -1,13 +1,10 @@
-import random
-import string
-from typing import Callable, List, NoReturn, Tuple, TypeVar
+import importlib
+from typing import Any, Callable, List, NoReturn, Tuple, TypeVar
 
 import click
 
 F = TypeVar("F", bound=Callable)
 
-FAKE_OPT_NAME_LEN = 30
-
 
 def get_callback_and_params(func) -> Tuple[Callable, List[click.Option]]:
     """Returns callback function and its parameters list
@@ -25,10 +22,6 @@ def get_callback_and_params(func) -> Tuple[Callable, List[click.Option]]:
     return func, params
 
 
-def get_fake_option_name(name_len: int = FAKE_OPT_NAME_LEN, prefix: str = "fake") -> str:
-    return f"--{prefix}-" + "".join(random.choices(string.ascii_lowercase, k=name_len))
-
-
 def raise_mixing_decorators_error(wrong_option: click.Option, callback: Callable) -> NoReturn:
     error_hint = wrong_option.opts or [wrong_option.name]
 
@@ -39,3 +32,17 @@ def raise_mixing_decorators_error(wrong_option: click.Option, callback: Callable
 def resolve_wrappers(f: F) -> F:
     """Get the underlying function behind any level of function wrappers."""
     return resolve_wrappers(f.__wrapped__) if hasattr(f, "__wrapped__") else f
+
+
+def resolve_object(module: str, qualname: str) -> Any:
+    """Imports the module and returns the object by its qualified name in the module"""
+    obj: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def import_object(import_path: str) -> Any:
+    """Returns the object by the import path in "package.module:attribute" format"""
+    module, _, qualname = import_path.partition(":")
+    return resolve_object(module, qualname)
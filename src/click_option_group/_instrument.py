@@ -0,0 +1,84 @@
+import functools
+import time
+from typing import Any, Callable, NamedTuple, Tuple, TypeVar, cast
+
+F = TypeVar("F", bound=Callable)
+
+
+class InstrumentationEvent(NamedTuple):
+    """The timing of one instrumented operation of an option group
+
+    :param operation: the operation name: "decorate_group", "decorate_option",
+        "validate", "error_hint" or "help_record"
+    :param group_name: the option group name
+    :param group_class: the option group class name
+    :param duration: the operation duration in seconds
+    """
+
+    operation: str
+    group_name: str
+    group_class: str
+    duration: float
+
+
+InstrumentationHook = Callable[[InstrumentationEvent], Any]
+GroupLabels = Callable[..., Tuple[str, str]]
+
+_hooks: Tuple[InstrumentationHook, ...] = ()
+
+
+def add_instrumentation_hook(hook: InstrumentationHook) -> InstrumentationHook:
+    """Adds the hook which is called with `InstrumentationEvent` after every instrumented operation
+
+    The operations are timed only while at least one hook is added.
+    The function can be used as a decorator.
+
+    :param hook: the callable which accepts `InstrumentationEvent`
+    :return: the hook
+    """
+    global _hooks  # noqa: PLW0603
+    _hooks = (*_hooks, hook)
+    return hook
+
+
+def remove_instrumentation_hook(hook: InstrumentationHook) -> None:
+    """Removes the hook which was added by `add_instrumentation_hook`
+
+    :param hook: the added hook
+    """
+    global _hooks  # noqa: PLW0603
+    hooks = list(_hooks)
+    hooks.remove(hook)
+    _hooks = tuple(hooks)
+
+
+def _group_labels(group: Any, *args: Any, **kwargs: Any) -> Tuple[str, str]:
+    return group.name, type(group).__name__
+
+
+def instrumented(operation: str, labels: GroupLabels = _group_labels) -> Callable[[F], F]:
+    """Times the calls of the function if instrumentation hooks are added
+
+    :param operation: the operation name
+    :param labels: the function which returns the group name and the group class name
+        for the arguments of the call. The first argument is the group by default
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _hooks:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                event = InstrumentationEvent(operation, *labels(*args, **kwargs), duration)
+                for hook in _hooks:
+                    hook(event)
+
+        return cast(F, wrapper)
+
+    return decorator
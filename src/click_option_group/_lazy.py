@@ -0,0 +1,178 @@
+import enum
+from gettext import gettext as _
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import click
+
+from ._commands import GroupedGroup
+from ._completion import _uses_fast_completion, complete_options
+from ._core import _get_command_index
+from ._helpers import import_object
+
+CommandManifest = Dict[str, Any]
+
+
+def get_command_manifest(command: click.Command) -> CommandManifest:
+    """Returns the JSON compatible description of the command and its option groups
+
+    The manifest contains the command help attributes and the option groups with their
+    kinds, constraints and grouped option declarations. `LazyGroup` uses the manifests to format the group help
+    and to complete the subcommand names without importing the subcommand modules.
+
+    :param command: the decorated command
+    :return: the command manifest
+    """
+    index = _get_command_index(command)
+
+    option_groups = []
+    for group, group_index in index.groups.items():
+        group_cls = type(group)
+        option_groups.append(
+            {
+                "name": group.name,
+                "help": group.help,
+                "class": f"{group_cls.__module__}:{group_cls.__qualname__}",
+                "kind": list(group.name_extra),
+                "constraints": [
+                    {"kind": compiled.constraint.kind, "options": list(compiled.names)}
+                    for compiled in index.constraints.get(group, ())
+                ],
+                "forbidden_option_attrs": list(group.forbidden_option_attrs),
+                "hidden": group_index.all_hidden,
+                "options": [_get_option_manifest(opt) for opt in group_index.options],
+            }
+        )
+
+    return {
+        "name": command.name,
+        "help": command.help,
+        "short_help": command.short_help,
+        "hidden": command.hidden,
+        "deprecated": command.deprecated,
+        "option_groups": option_groups,
+    }
+
+
+def _get_option_manifest(option: click.Option) -> Dict[str, Any]:
+    manifest = {
+        "name": option.name,
+        "opts": list(option.opts),
+        "secondary_opts": list(option.secondary_opts),
+        # The custom parameter types can have no name
+        "type": getattr(option.type, "name", type(option.type).__name__),
+        "nargs": option.nargs,
+        "multiple": option.multiple,
+        "is_flag": option.is_flag,
+        "required": option.required,
+        "hidden": option.hidden,
+        "help": option.help,
+    }
+
+    choices = getattr(option.type, "choices", None)
+    if choices is not None:
+        manifest["choices"] = [choice.name if isinstance(choice, enum.Enum) else str(choice) for choice in choices]
+
+    return manifest
+
+
+class LazyGroup(GroupedGroup):
+    """The group of commands which imports the subcommands only when they are used
+
+    The subcommand modules (and their option group decorators) are imported only when
+    the subcommand is invoked, its help is requested or its options are completed.
+    The group help and the completion of the subcommand names use the subcommand
+    manifests (see `get_command_manifest`) instead of the subcommands if they are given.
+
+    The example of usage::
+
+        @click.group(
+            cls=LazyGroup,
+            lazy_subcommands={"build": "mytool.build:build"},
+            manifests={"build": {"short_help": "Build the project"}},
+        )
+        def cli():
+            pass
+
+    :param name: the group name
+    :param commands: the mapping of the regular subcommands
+    :param lazy_subcommands: the mapping of the subcommand names to the import paths
+        of the subcommands in "package.module:attribute" format
+    :param manifests: the mapping of the subcommand names to the subcommand manifests.
+        The subcommands without manifests are imported for the group help
+    :param attrs: additional group attributes
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        commands: Optional[Mapping[str, click.Command]] = None,
+        *,
+        lazy_subcommands: Optional[Mapping[str, str]] = None,
+        manifests: Optional[Mapping[str, CommandManifest]] = None,
+        **attrs: Any,
+    ) -> None:
+        super().__init__(name, commands, **attrs)
+        self.lazy_subcommands: Dict[str, str] = dict(lazy_subcommands or {})
+        self.manifests: Dict[str, CommandManifest] = dict(manifests or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        commands = list(self._iter_listed_commands(ctx))
+
+        if commands:
+            # allow for 3 times the default spacing
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            rows = [(name, cmd.get_short_help_str(limit)) for name, cmd in commands]
+
+            with formatter.section(_("Commands")):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> List[Any]:
+        from click.shell_completion import CompletionItem  # noqa: PLC0415 (click 8 only)
+
+        results = [
+            CompletionItem(name, help=cmd.get_short_help_str())
+            for name, cmd in self._iter_listed_commands(ctx)
+            if name.startswith(incomplete)
+        ]
+        if _uses_fast_completion(ctx, incomplete):
+            results.extend(complete_options(ctx, incomplete))
+        else:
+            # The options and the chained commands are completed by the base command class
+            results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+    def _load_command(self, cmd_name: str) -> None:
+        import_path = self.lazy_subcommands[cmd_name]
+        command = import_object(import_path)
+
+        if not isinstance(command, click.Command):
+            msg = (
+                f"The lazy subcommand '{cmd_name}' of '{self.name}' group must be a click command, got {import_path!r}."
+            )
+            raise TypeError(msg)
+
+        self.add_command(command, cmd_name)
+
+    def _iter_listed_commands(self, ctx: click.Context) -> Iterator[Tuple[str, click.Command]]:
+        """Yields the visible subcommands or their placeholders made from the manifests"""
+        for name in self.list_commands(ctx):
+            if name not in self.commands and name in self.manifests:
+                cmd: Optional[click.Command] = _make_placeholder_command(name, self.manifests[name])
+            else:
+                cmd = self.get_command(ctx, name)
+
+            if cmd is not None and not cmd.hidden:
+                yield name, cmd
+
+
+def _make_placeholder_command(name: str, manifest: CommandManifest) -> click.Command:
+    attrs = {attr: manifest[attr] for attr in ("help", "short_help", "hidden", "deprecated") if attr in manifest}
+    return click.Command(name, **attrs)
@@ -0,0 +1,148 @@
+import hashlib
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+import click
+
+from ._core import GroupedOption
+from ._helpers import resolve_wrappers
+from ._lazy import CommandManifest, get_command_manifest
+
+MANIFEST_FORMAT_VERSION = 1
+
+_MANIFEST_FORMATS = ("json", "msgpack")
+
+
+def export_manifest(command: click.Command, file: IO[bytes], *, format: str = "json") -> None:
+    """Exports the manifest of the command tree with option groups to the binary file
+
+    The manifest describes every command of the tree by `get_command_manifest` and contains
+    the subcommands of the groups in "commands" mapping. The tools which read the manifest
+    do not need to import the commands. The subcommand manifests can be passed to `LazyGroup`.
+
+    The manifest also contains the hashes of the source files of the modules which define
+    the commands, the option groups and the option types, `is_manifest_current` uses them
+    to check that the manifest is still current.
+
+    :param command: the command or the group of commands
+    :param file: the binary file object
+    :param format: "json" or "msgpack". The msgpack format requires `msgpack` package
+    """
+    dumps = _get_serializer(format)[0]
+
+    modules: Set[str] = set()
+    tree = _get_tree_manifest(command, click.Context(command, info_name=command.name), modules)
+
+    manifest = {
+        "format": MANIFEST_FORMAT_VERSION,
+        "sources": _get_sources_hashes(modules),
+        "command": tree,
+    }
+
+    file.write(dumps(manifest))
+
+
+def load_manifest(file: IO[bytes], *, format: str = "json") -> Dict[str, Any]:
+    """Loads the manifest which was exported by `export_manifest`
+
+    :param file: the binary file object
+    :param format: "json" or "msgpack"
+    :return: the manifest with "format", "sources" and "command" items
+    """
+    loads = _get_serializer(format)[1]
+    return loads(file.read())
+
+
+def is_manifest_current(manifest: Dict[str, Any]) -> bool:
+    """Returns True if the source files of the exported commands were not changed
+
+    The source files are found by the module names without importing the modules,
+    but the parent packages of the modules are imported.
+
+    :param manifest: the manifest loaded by `load_manifest`
+    """
+    if manifest.get("format") != MANIFEST_FORMAT_VERSION:
+        return False
+
+    sources = manifest["sources"]
+    return _get_sources_hashes(sources) == sources
+
+
+def _get_tree_manifest(command: click.Command, ctx: click.Context, modules: Set[str]) -> CommandManifest:
+    manifest = get_command_manifest(command)
+    _add_command_modules(command, modules)
+
+    if isinstance(command, click.Group):
+        commands = {}
+        for name in command.list_commands(ctx):
+            subcommand = command.get_command(ctx, name)
+            if subcommand is not None:
+                sub_ctx = click.Context(subcommand, parent=ctx, info_name=name)
+                commands[name] = _get_tree_manifest(subcommand, sub_ctx, modules)
+        manifest["commands"] = commands
+
+    return manifest
+
+
+def _add_command_modules(command: click.Command, modules: Set[str]) -> None:
+    """Adds the names of the modules which define the command, its callback, option groups and option types"""
+    modules.add(type(command).__module__)
+    if command.callback is not None:
+        modules.add(resolve_wrappers(command.callback).__module__)
+
+    for param in command.params:
+        modules.add(type(param).__module__)
+        modules.add(type(param.type).__module__)
+        if isinstance(param, GroupedOption):
+            modules.add(type(param.group).__module__)
+
+
+def _get_serializer(format: str) -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    if format not in _MANIFEST_FORMATS:
+        msg = f"Unknown manifest format {format!r}, expected one of {_MANIFEST_FORMATS}."
+        raise ValueError(msg)
+
+    if format == "json":
+        return (
+            lambda manifest: json.dumps(manifest, separators=(",", ":")).encode(),
+            lambda data: json.loads(data.decode()),
+        )
+
+    try:
+        import msgpack  # noqa: PLC0415 (optional dependency)
+    except ImportError as error:
+        msg = "The msgpack manifest format requires 'msgpack' package."
+        raise ImportError(msg) from error
+
+    return msgpack.packb, msgpack.unpackb
+
+
+def _get_module_file(module: str) -> Optional[str]:
+    loaded = sys.modules.get(module)
+    if loaded is not None:
+        return getattr(loaded, "__file__", None)
+
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        return None
+
+    return spec.origin if spec is not None and spec.has_location else None
+
+
+def _get_sources_hashes(modules: Iterable[str]) -> Dict[str, Optional[str]]:
+    hashes = {}
+
+    for module in sorted(modules):
+        path = _get_module_file(module)
+        try:
+            data = Path(path).read_bytes() if path else None
+        except OSError:
+            data = None
+
+        hashes[module] = f"sha256:{hashlib.sha256(data).hexdigest()}" if data is not None else None
+
+    return hashes
@@ -1,3 +1,14 @@
+import io
+import pickle
+import socket
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
 import click
@@ -5,13 +16,39 @@ import pytest
 
 from click_option_group import (
     AllOptionGroup,
+    AtLeast,
+    AtMost,
+    CompletionDaemon,
+    Constraint,
+    EmptyOptionGroupWarning,
+    Exactly,
+    GroupedCommand,
+    GroupedGroup,
     GroupedOption,
+    Implies,
+    InstrumentationEvent,
+    LazyGroup,
     MutuallyExclusiveOptionGroup,
     OptionGroup,
+    OptionGroupUsageError,
+    OptionGroupViolation,
     RequiredAllOptionGroup,
     RequiredAnyOptionGroup,
     RequiredMutuallyExclusiveOptionGroup,
+    add_instrumentation_hook,
+    build_groups,
+    complete_options,
+    dump_command,
+    export_manifest,
+    get_command_manifest,
+    is_manifest_current,
+    load_cached_command,
+    load_command,
+    load_manifest,
     optgroup,
+    query_daemon,
+    remove_instrumentation_hook,
+    validate_many,
 )
 
 
@@ -142,6 +179,57 @@ def test_missing_group_decl_first_api(runner):
     assert "--bar" in str(result.exc_info[1])
 
 
+def test_grouped_options_created_once():
+    created = []
+
+    class CountingOption(GroupedOption):
+        def __init__(self, *args, **kwargs):
+            created.append(args)
+            super().__init__(*args, **kwargs)
+
+    @click.command()
+    @click.option("--hello")
+    @optgroup("Group")
+    @optgroup.option("--foo", cls=CountingOption)
+    @optgroup.option("--bar", cls=CountingOption)
+    def cli(**params):
+        pass
+
+    assert len(created) == 2
+    assert [param.name for param in cli.params if isinstance(param, click.Option)][-2:] == ["foo", "bar"]
+    assert not any("not_attached" in param.name for param in cli.params)
+
+
+def test_concurrent_decoration(runner):
+    threads_count = 8
+    barrier = threading.Barrier(threads_count)
+
+    def make_command(index):
+        def cli(**params):
+            click.echo(",".join(f"{k}={v}" for k, v in sorted(params.items())))
+
+        func = optgroup.option(f"--bar{index}")(cli)
+        barrier.wait()
+        func = optgroup.option(f"--foo{index}")(func)
+        func = optgroup.group(f"Group {index}", cls=RequiredAnyOptionGroup)(func)
+        barrier.wait()
+        return click.command(f"cli{index}")(func)
+
+    with ThreadPoolExecutor(threads_count) as executor:
+        commands = list(executor.map(make_command, range(threads_count)))
+
+    for index, cli in enumerate(commands):
+        result = runner.invoke(cli, ["--help"])
+        assert not result.exception
+        assert f"Group {index}:" in result.output
+        assert f"--foo{index}" in result.output
+        assert f"--bar{index}" in result.output
+
+        result = runner.invoke(cli, [f"--foo{index}", "foo"])
+        assert not result.exception
+        assert f"bar{index}=None,foo{index}=foo" in result.output
+
+
 def test_missing_grouped_options_decl_first_api(runner):
     with pytest.warns(RuntimeWarning, match=r'The empty option group "Group 1"'):
 
@@ -161,6 +249,36 @@ def test_missing_grouped_options_decl_first_api(runner):
     assert "--hello2" in result.output
 
 
+def test_empty_group_action(monkeypatch, recwarn):
+    monkeypatch.setattr(optgroup, "empty_group_action", "ignore")
+
+    @click.command()
+    @optgroup("Group 1")
+    def cli1(**params):
+        pass
+
+    assert not recwarn.list
+
+    monkeypatch.setattr(optgroup, "empty_group_action", "collect")
+
+    @click.command()
+    @optgroup("Group 2")
+    def cli2(**params):
+        pass
+
+    assert not recwarn.list
+
+    empty_group_warnings = optgroup.pop_empty_group_warnings()
+    assert len(empty_group_warnings) == 1
+    assert empty_group_warnings[0].category is EmptyOptionGroupWarning
+    assert 'The empty option group "Group 2"' in str(empty_group_warnings[0].message)
+    assert empty_group_warnings[0].filename == __file__
+    assert optgroup.pop_empty_group_warnings() == []
+
+    with pytest.raises(ValueError, match="'empty_group_action' must be one of"):
+        optgroup.empty_group_action = "oops"
+
+
 def test_incorrect_option_group_cls():
     with pytest.raises(TypeError, match=r"must be a subclass of 'OptionGroup' class"):
 
@@ -448,6 +566,213 @@ def test_required_mutually_exclusive_option_group(runner):
     assert "--spam" in result.output
 
 
+@pytest.mark.parametrize(
+    "cls",
+    [
+        OptionGroup,
+        RequiredAnyOptionGroup,
+        RequiredAllOptionGroup,
+        MutuallyExclusiveOptionGroup,
+        RequiredMutuallyExclusiveOptionGroup,
+        AllOptionGroup,
+    ],
+)
+def test_validate_once_per_context(runner, cls):
+    calls = []
+
+    class CountingGroup(cls):
+        def validate(self, ctx, opts):
+            calls.append(ctx)
+            super().validate(ctx, opts)
+
+    @click.command()
+    @optgroup(cls=CountingGroup)
+    @optgroup.option("--foo")
+    @optgroup.option("--bar")
+    @optgroup.option("--spam")
+    def cli(foo, bar, spam):
+        pass
+
+    runner.invoke(cli, ["--foo", "foo", "--bar", "bar", "--spam", "spam"])
+    assert len(calls) == 1
+
+    runner.invoke(cli, ["--foo", "foo"])
+    assert len(calls) == 2
+    assert calls[0] is not calls[1]
+
+
+def test_validate_shared_group_in_subcommand(runner):
+    group = RequiredAnyOptionGroup("Group")
+
+    @click.group()
+    @group.option("--foo1")
+    @group.option("--bar1")
+    def cli(foo1, bar1):
+        pass
+
+    @cli.command()
+    @group.option("--foo2")
+    @group.option("--bar2")
+    def command(foo2, bar2):
+        pass
+
+    result = runner.invoke(cli, ["--foo1", "foo1", "command"])
+    assert result.exception
+    assert result.exit_code == 2
+    assert "--foo2" in result.output
+    assert "--bar2" in result.output
+
+    result = runner.invoke(cli, ["--foo1", "foo1", "command", "--bar2", "bar2"])
+    assert not result.exception
+
+
+def test_group_title_option_is_deterministic():
+    code = textwrap.dedent(
+        """
+        import click
+        from click_option_group import optgroup
+
+        @click.command()
+        @optgroup("Group 1")
+        @optgroup.option("--foo")
+        @optgroup("Group 2")
+        @optgroup.option("--bar")
+        def cli(**params):
+            pass
+
+        print([(param.name, param.opts) for param in cli.params])
+        """
+    )
+
+    outputs = {subprocess.check_output([sys.executable, "-c", code], text=True) for _ in range(2)}
+    assert len(outputs) == 1
+
+
+def test_group_title_option_is_not_parsed():
+    @click.command()
+    @optgroup("Group")
+    @optgroup.option("--foo")
+    def cli(**params):
+        pass
+
+    title_option = cli.params[0]
+    assert not isinstance(title_option, GroupedOption)
+    assert title_option.opts == []
+    assert title_option.secondary_opts == []
+
+    ctx = cli.make_context("cli", ["--foo", "foo"])
+    assert ctx.params == {"foo": "foo"}
+    assert ctx.get_parameter_source(title_option.name) is None
+
+
+def test_help_records_cache(runner):
+    group = OptionGroup("Group", help="Group description")
+
+    @group.option("--foo", help="Foo option")
+    @group.option("--bar", default="bar", show_default=True)
+    @click.command()
+    def cli(**params):
+        pass
+
+    result = runner.invoke(cli, ["--help"])
+    assert not result.exception
+    assert "Group:" in result.output
+    assert "Foo option" in result.output
+    assert "[default: bar]" in result.output
+
+    ctx = cli.make_context("cli", [])
+    title_option = next(param for param in cli.params if not isinstance(param, GroupedOption))
+    foo_option = group.get_options(ctx)["foo"]
+
+    help_record = foo_option.get_help_record(ctx)
+    assert help_record == ("  --foo TEXT", "Foo option")
+    assert foo_option.get_help_record(cli.make_context("cli", [])) is help_record
+    assert title_option.get_help_record(ctx) == ("Group: ", "Group description")
+
+    narrow_ctx = cli.make_context("cli", [], terminal_width=40)
+    assert foo_option.get_help_record(narrow_ctx) is not help_record
+
+    default_map_ctx = cli.make_context("cli", [], default_map={"bar": "spam"})
+    bar_option = group.get_options(default_map_ctx)["bar"]
+    assert "[default: spam]" in bar_option.get_help_record(default_map_ctx)[1]
+    assert "[default: bar]" in bar_option.get_help_record(ctx)[1]
+
+    cli = group.option("--spam", help="Spam option")(cli)
+    result = runner.invoke(cli, ["--help"])
+    assert not result.exception
+    assert "Spam option" in result.output
+
+
+@pytest.mark.parametrize(
+    ("cls", "args", "kind", "option_names"),
+    [
+        (RequiredAnyOptionGroup, [], "required_any", ("foo", "bar", "spam")),
+        (RequiredAllOptionGroup, ["--bar", "bar"], "required_all", ("foo", "spam")),
+        (MutuallyExclusiveOptionGroup, ["--spam", "1", "--foo", "2"], "mutually_exclusive", ("foo", "spam")),
+        (RequiredMutuallyExclusiveOptionGroup, [], "required_mutually_exclusive", ("foo", "bar", "spam")),
+        (AllOptionGroup, ["--foo", "foo"], "all_or_none", ("foo", "bar", "spam")),
+    ],
+)
+def test_option_group_usage_error(cls, args, kind, option_names):
+    @click.command()
+    @optgroup("Group", cls=cls)
+    @optgroup.option("--foo")
+    @optgroup.option("--bar")
+    @optgroup.option("--spam")
+    def cli(**params):
+        pass
+
+    with pytest.raises(OptionGroupUsageError) as exc_info:
+        cli.main(args, standalone_mode=False)
+
+    error = exc_info.value
+    assert isinstance(error, click.UsageError)
+    assert isinstance(error.group, cls)
+    assert error.kind == kind
+    assert error.option_names == option_names
+    assert error._message is None
+
+    message = error.format_message()
+    assert "'Group' option group" in message
+    assert message.endswith("\n".join(f"  '--{name}'" for name in option_names))
+    assert str(error) == message
+
+
+def test_option_group_usage_error_without_context():
+    group = RequiredAllOptionGroup("Group")
+
+    # The options are described by their names without the context
+    error = OptionGroupUsageError(group, ["foo", "bar"], "required_all")
+    assert str(error) == "Missing required options from 'Group' option group:\n  'foo'\n  'bar'"
+
+    violation = pickle.loads(pickle.dumps(OptionGroupViolation(group, ["foo"], "required_all")))
+    assert violation.message == "Missing required options from 'Group' option group:\n  'foo'"
+
+
+def test_group_options_index():
+    group = OptionGroup("Group")
+
+    @click.command()
+    @click.option("--hello")
+    @group.option("--foo")
+    @group.option("--bar")
+    def cli(**params):
+        pass
+
+    ctx = cli.make_context("cli", [])
+    assert group.get_option_names(ctx) == ["foo", "bar"]
+    assert list(group.get_options(ctx)) == ["bar", "foo"]
+    assert group.get_options(ctx) is group.get_options(ctx)
+    assert group.get_error_hint(ctx) == "  '--foo'\n  '--bar'"
+    assert group.get_error_hint(ctx, {"bar"}) == "  '--bar'"
+
+    other_group = OptionGroup("Other Group")
+    assert other_group.get_options(ctx) == {}
+
+    cli = group.option("--spam")(cli)
+    assert set(group.get_option_names(ctx)) == {"foo", "bar", "spam"}
+
+
 @pytest.mark.parametrize(
     "cls",
     [
@@ -749,6 +1074,11 @@ def test_hidden_option(runner):
     assert isinstance(result.exception, TypeError)
     assert "Need at least one non-hidden" in str(result.exception)
 
+    # The hidden options can be used
+    result = runner.invoke(cli, ["--foo", "1"])
+    assert not result.exception
+    assert result.output == "1,None\n"
+
     @click.command()
     @optgroup("Group 1", help="Group 1 description")
     @optgroup.option("--foo", hidden=True)
@@ -864,3 +1194,1103 @@ def test_wrapped_functions(runner):
     assert "Group abc" in result.output
     assert "-a" in result.output
     assert "-b" in result.output
+
+
+@click.group()
+@optgroup("Server", cls=RequiredAnyOptionGroup, help="Server options")
+@optgroup.option("--host", default="localhost", show_default=True)
+@optgroup.option("--port", type=int)
+def serialized_cli(host, port):
+    click.echo(f"{host}:{port}")
+
+
+@serialized_cli.command()
+@optgroup("Input", cls=RequiredMutuallyExclusiveOptionGroup)
+@optgroup.option("--file", type=click.Path())
+@optgroup.option("--url")
+def serialized_command(file, url):
+    click.echo(f"{file},{url}")
+
+
+def test_dump_load_command(runner):
+    file = io.BytesIO()
+    dump_command(serialized_cli, file)
+    file.seek(0)
+    cli = load_command(file)
+
+    assert cli is not serialized_cli
+
+    for args in (
+        ["--help"],
+        ["--host", "example.com", "serialized-command", "--help"],
+        ["--port", "80", "serialized-command", "--url", "url"],
+        ["serialized-command", "--url", "url"],
+        ["--port", "80", "serialized-command"],
+        ["--port", "80", "serialized-command", "--url", "url", "--file", "file"],
+    ):
+        expected = runner.invoke(serialized_cli, args)
+        result = runner.invoke(cli, args)
+
+        assert result.output == expected.output
+        assert result.exit_code == expected.exit_code
+
+
+def test_load_cached_command_is_lazy(tmp_path):
+    (tmp_path / "grouped_cli.py").write_text(
+        textwrap.dedent(
+            """
+            import click
+            from click_option_group import optgroup, RequiredAnyOptionGroup
+
+            @click.command()
+            @optgroup("Group", cls=RequiredAnyOptionGroup)
+            @optgroup.option("--foo")
+            @optgroup.option("--bar")
+            def cli(foo, bar):
+                click.echo(f"{foo},{bar}")
+            """
+        )
+    )
+    code = textwrap.dedent(
+        """
+        import sys
+        from click_option_group import load_cached_command
+
+        cli = load_cached_command(sys.argv[1], "grouped_cli:cli")
+        print("imported" if "grouped_cli" in sys.modules else "restored")
+        cli.main(sys.argv[2:], standalone_mode=False)
+        """
+    )
+
+    def run(*args):
+        return subprocess.run(
+            [sys.executable, "-c", code, str(tmp_path / "cli.cache"), *args],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    result = run("--foo", "foo")
+    assert result.stdout == "imported\nfoo,None\n"
+
+    result = run("--bar", "bar")
+    assert result.stdout == "restored\nNone,bar\n"
+
+    result = run()
+    assert result.stdout == "restored\n"
+    assert "At least one of the following options from 'Group' option group is required" in result.stderr
+
+    (tmp_path / "grouped_cli.py").write_text((tmp_path / "grouped_cli.py").read_text().replace("bar", "spam"))
+    result = run("--spam", "spam")
+    assert result.stdout == "imported\nNone,spam\n"
+
+
+def test_load_cached_command_not_picklable(runner, tmp_path):
+    @click.command()
+    @optgroup("Group")
+    @optgroup.option("--foo", default=lambda: "default")
+    def cli(foo):
+        click.echo(foo)
+
+    cache_path = tmp_path / "cli.cache"
+    command = load_cached_command(cache_path, lambda: cli)
+
+    assert command is cli
+    assert list(tmp_path.iterdir()) == []
+
+    result = runner.invoke(command, [])
+    assert not result.exception
+    assert result.output == "default\n"
+
+    # The cache file cannot be written to the missing directory
+    assert load_cached_command(tmp_path / "missing" / "cli.cache", lambda: cli) is cli
+
+
+def test_command_manifest():
+    @click.command(short_help="Short help")
+    @optgroup("Group 1", cls=RequiredAnyOptionGroup, help="Group 1 help", constraints=[AtMost(1)])
+    @optgroup.option("--foo", type=click.Choice(["a", "b"]), help="Foo help")
+    @optgroup.option("--bar/--no-bar")
+    @click.option("--spam")
+    def cli(**params):
+        pass
+
+    assert get_command_manifest(cli) == {
+        "name": "cli",
+        "help": None,
+        "short_help": "Short help",
+        "hidden": False,
+        "deprecated": False,
+        "option_groups": [
+            {
+                "name": "Group 1",
+                "help": "Group 1 help",
+                "class": "click_option_group._core:RequiredAnyOptionGroup",
+                "kind": ["required_any"],
+                "constraints": [{"kind": "at_most", "options": ["foo", "bar"]}],
+                "forbidden_option_attrs": ["required"],
+                "hidden": False,
+                "options": [
+                    {
+                        "name": "foo",
+                        "opts": ["--foo"],
+                        "secondary_opts": [],
+                        "type": "choice",
+                        "nargs": 1,
+                        "multiple": False,
+                        "is_flag": False,
+                        "required": False,
+                        "hidden": False,
+                        "help": "Foo help",
+                        "choices": ["a", "b"],
+                    },
+                    {
+                        "name": "bar",
+                        "opts": ["--bar"],
+                        "secondary_opts": ["--no-bar"],
+                        "type": "boolean",
+                        "nargs": 1,
+                        "multiple": False,
+                        "is_flag": True,
+                        "required": False,
+                        "hidden": False,
+                        "help": None,
+                    },
+                ],
+            }
+        ],
+    }
+
+    class UnnamedType(click.ParamType):
+        def convert(self, value, param, ctx):
+            return value
+
+    @click.command()
+    @optgroup("Group")
+    @optgroup.option("--foo", type=UnnamedType())
+    def unnamed_type_cli(foo):
+        pass
+
+    [option] = get_command_manifest(unnamed_type_cli)["option_groups"][0]["options"]
+    assert option["type"] == "UnnamedType"
+
+
+def test_export_manifest(tmp_path, monkeypatch):
+    source = textwrap.dedent(
+        """
+        import click
+        from click_option_group import optgroup, MutuallyExclusiveOptionGroup
+
+        @click.group()
+        def cli():
+            pass
+
+        @cli.command()
+        @optgroup("Group", cls=MutuallyExclusiveOptionGroup)
+        @optgroup.option("--foo")
+        @optgroup.option("--bar")
+        def sub(foo, bar):
+            pass
+        """
+    )
+    (tmp_path / "manifest_commands.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "manifest_commands", raising=False)
+
+    import manifest_commands  # noqa: PLC0415
+
+    file = io.BytesIO()
+    export_manifest(manifest_commands.cli, file)
+    file.seek(0)
+    manifest = load_manifest(file)
+
+    sub_manifest = manifest["command"]["commands"]["sub"]
+    assert sub_manifest == get_command_manifest(manifest_commands.sub)
+    assert sub_manifest["option_groups"][0]["kind"] == ["mutually_exclusive"]
+    assert "manifest_commands" in manifest["sources"]
+    assert is_manifest_current(manifest)
+
+    (tmp_path / "manifest_commands.py").write_text(source.replace("--bar", "--baz"))
+    assert not is_manifest_current(manifest)
+
+    with pytest.raises(ValueError, match="Unknown manifest format"):
+        export_manifest(manifest_commands.cli, io.BytesIO(), format="yaml")
+
+
+def test_lazy_group(runner, tmp_path, monkeypatch):
+    (tmp_path / "lazy_commands.py").write_text(
+        textwrap.dedent(
+            """
+            import click
+            from click_option_group import optgroup, RequiredAnyOptionGroup
+
+            @click.command(help="Grouped command help")
+            @optgroup("Group", cls=RequiredAnyOptionGroup)
+            @optgroup.option("--foo")
+            @optgroup.option("--bar")
+            def grouped(foo, bar):
+                click.echo(f"{foo},{bar}")
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_commands", raising=False)
+
+    def make_cli(manifests):
+        @click.group(cls=LazyGroup, lazy_subcommands={"grouped": "lazy_commands:grouped"}, manifests=manifests)
+        def cli():
+            pass
+
+        @cli.command(help="Plain command help")
+        def plain():
+            pass
+
+        return cli
+
+    manifests = {"grouped": {"help": "Grouped command help"}}
+
+    result = runner.invoke(make_cli(manifests), ["--help"])
+    assert not result.exception
+    assert "grouped  Grouped command help" in result.output
+    assert "plain    Plain command help" in result.output
+    assert "lazy_commands" not in sys.modules
+
+    ctx = make_cli(manifests).make_context("cli", [], resilient_parsing=True)
+    completions = ctx.command.shell_complete(ctx, "g")
+    assert [(item.value, item.help) for item in completions] == [("grouped", "Grouped command help")]
+    assert "lazy_commands" not in sys.modules
+
+    cli = make_cli(manifests)
+    result = runner.invoke(cli, ["grouped"])
+    assert isinstance(result.exception, SystemExit)
+    assert "At least one of the following options from 'Group' option group is required" in result.output
+    assert "lazy_commands" in sys.modules
+
+    result = runner.invoke(cli, ["grouped", "--bar", "bar"])
+    assert not result.exception
+    assert result.output == "None,bar\n"
+
+    result = runner.invoke(cli, ["grouped", "--help"])
+    assert not result.exception
+    assert "Group: [required_any]" in result.output
+
+    assert get_command_manifest(cli.get_command(None, "grouped"))["help"] == manifests["grouped"]["help"]
+
+    result = runner.invoke(make_cli({}), ["--help"])
+    assert "grouped  Grouped command help" in result.output
+
+
+def test_lazy_group_wrong_command(tmp_path, monkeypatch):
+    (tmp_path / "lazy_commands_wrong.py").write_text("grouped = None\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    @click.group(cls=LazyGroup, lazy_subcommands={"grouped": "lazy_commands_wrong:grouped"})
+    def cli():
+        pass
+
+    with pytest.raises(TypeError, match="The lazy subcommand 'grouped' of 'cli' group must be a click command"):
+        cli.get_command(None, "grouped")
+
+
+@pytest.mark.parametrize(
+    ("constraint", "args", "message"),
+    [
+        (AtMost(2), ["--foo", "1", "--bar", "2"], None),
+        (
+            AtMost(1),
+            ["--foo", "1", "--spam", "3"],
+            (
+                "At most 1 of the following options from 'Group' option group can be used at the same time:\n"
+                "  '--foo'\n  '--spam'"
+            ),
+        ),
+        (AtLeast(2, "foo", "bar", "spam"), ["--bar", "2", "--spam", "3"], None),
+        (
+            AtLeast(2),
+            ["--bar", "2"],
+            (
+                "At least 2 of the following options from 'Group' option group are required:\n"
+                "  '--foo'\n  '--bar'\n  '--spam'"
+            ),
+        ),
+        (Exactly(1, "foo", "bar"), ["--bar", "2", "--spam", "3"], None),
+        (
+            Exactly(1, "foo", "bar"),
+            ["--foo", "1", "--bar", "2"],
+            "Exactly 1 of the following options from 'Group' option group should be specified:\n  '--foo'\n  '--bar'",
+        ),
+        (Implies("foo", "bar", "spam"), ["--bar", "2"], None),
+        (
+            Implies("foo", "bar", "spam"),
+            ["--foo", "1", "--bar", "2"],
+            "Option '--foo' from 'Group' option group requires the following options:\n  '--spam'",
+        ),
+        (
+            Implies("spam", "other"),
+            ["--spam", "3"],
+            "Option '--spam' from 'Group' option group requires the following options:\n  '--other'",
+        ),
+    ],
+)
+def test_group_constraints(runner, constraint, args, message):
+    @click.command()
+    @optgroup("Group", constraints=[constraint])
+    @optgroup.option("--foo")
+    @optgroup.option("--bar")
+    @optgroup.option("--spam")
+    @optgroup("Other group")
+    @optgroup.option("--other")
+    def cli(**params):
+        click.echo("ok")
+
+    result = runner.invoke(cli, args)
+
+    if message is None:
+        assert not result.exception
+        assert result.output == "ok\n"
+    else:
+        assert isinstance(result.exception, SystemExit)
+        assert f"Error: {message}" in result.output
+
+
+def test_group_constraints_errors():
+    with pytest.raises(ValueError, match="'count' must be a non-negative integer"):
+        AtMost(-1)
+
+    with pytest.raises(TypeError, match="'Implies' constraint requires at least one required option name"):
+        Implies("foo")
+
+    class Incomplete(Constraint):
+        kind = "incomplete"
+
+    # The constraint without `is_satisfied` cannot be created
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete("foo")
+
+    @click.command()
+    @optgroup("Group", constraints=[AtMost(1, "foo", "unknown")])
+    @optgroup.option("--foo")
+    def cli(**params):
+        pass
+
+    with pytest.raises(TypeError, match=r"Unknown option 'unknown' in AtMost\(1, 'foo', 'unknown'\) constraint"):
+        cli.main([], standalone_mode=False)
+
+
+def test_group_constraints_with_group_validation(runner):
+    @click.command()
+    @optgroup("Group", cls=RequiredAnyOptionGroup, constraints=[AtMost(1)])
+    @optgroup.option("--foo")
+    @optgroup.option("--bar")
+    def cli(**params):
+        pass
+
+    result = runner.invoke(cli, [])
+    assert "At least one of the following options from 'Group' option group is required" in result.output
+
+    result = runner.invoke(cli, ["--foo", "1", "--bar", "2"])
+    assert "At most 1 of the following options from 'Group' option group" in result.output
+
+
+@pytest.mark.parametrize(
+    ("cls", "args", "message"),
+    [
+        (MutuallyExclusiveOptionGroup, ["--opt99"], None),
+        (MutuallyExclusiveOptionGroup, ["--opt0", "--opt99"], "Mutually exclusive options from"),
+        (RequiredAnyOptionGroup, ["--opt5", "--opt99"], None),
+        (RequiredAllOptionGroup, ["--opt99"], "Missing required options from"),
+        (AllOptionGroup, [f"--opt{i}" for i in range(100)], None),
+        (AllOptionGroup, [f"--opt{i}" for i in range(99)], "All options from"),
+        (RequiredMutuallyExclusiveOptionGroup, ["--other"], "Missing one of the required mutually exclusive options"),
+    ],
+)
+def test_validate_many_options(runner, cls, args, message):
+    def cli(**params):
+        click.echo(sum(1 for value in params.values() if value))
+
+    for index in reversed(range(100)):
+        cli = optgroup.option(f"--opt{index}", is_flag=True)(cli)
+    cli = optgroup.group("Group", cls=cls)(cli)
+    cli = click.option("--other", is_flag=True)(cli)
+    cli = click.command()(cli)
+
+    result = runner.invoke(cli, args)
+
+    if message is None:
+        assert not result.exception
+        assert result.output == f"{len(args)}\n"
+    else:
+        assert isinstance(result.exception, SystemExit)
+        assert message in result.output
+
+
+def test_instrumentation_hooks(runner):
+    events = []
+    hook = add_instrumentation_hook(events.append)
+
+    try:
+
+        @click.command()
+        @optgroup("Group", cls=RequiredAnyOptionGroup)
+        @optgroup.option("--foo")
+        @optgroup.option("--bar")
+        def cli(foo, bar):
+            pass
+
+        decoration_events = list(events)
+        events.clear()
+
+        result = runner.invoke(cli, [])
+        error_events = list(events)
+        events.clear()
+
+        runner.invoke(cli, ["--help"])
+        help_events = list(events)
+    finally:
+        remove_instrumentation_hook(hook)
+
+    assert isinstance(result.exception, SystemExit)
+    assert all(isinstance(event, InstrumentationEvent) for event in events)
+    assert all(event.duration >= 0 for event in events)
+
+    labels = ("Group", "RequiredAnyOptionGroup")
+    assert [event[:3] for event in decoration_events] == [
+        ("decorate_option", *labels),
+        ("decorate_option", *labels),
+        ("decorate_group", *labels),
+    ]
+    assert ("validate", *labels) in [event[:3] for event in error_events]
+    assert ("error_hint", *labels) in [event[:3] for event in error_events]
+    assert {event[:3] for event in help_events} == {("help_record", *labels)}
+
+    events.clear()
+    runner.invoke(cli, ["--foo", "1"])
+    assert not events
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_validate_many(processes):
+    argv_list = [
+        ["--file", "file"],
+        ["--url", "url"],
+        [],
+        ["--file", "file", "--url", "url"],
+        ["--unknown"],
+    ] * 3
+
+    results = list(validate_many(serialized_command, iter(argv_list), processes=processes, chunksize=2))
+
+    assert [result.argv for result in results] == [tuple(argv) for argv in argv_list]
+    assert [result.ok for result in results] == [True, True, False, False, False] * 3
+
+    [violation] = results[2].violations
+    assert violation.to_dict() == {
+        "group_name": "Input",
+        "group_class": "RequiredMutuallyExclusiveOptionGroup",
+        "kind": "required_mutually_exclusive",
+        "option_names": ["file", "url"],
+        "given": [],
+        "missing": ["file", "url"],
+        "conflicting": [],
+        "message": (
+            "Missing one of the required mutually exclusive options from 'Input' option group:\n  '--file'\n  '--url'"
+        ),
+    }
+    [violation] = results[3].violations
+    assert violation.kind == "mutually_exclusive"
+    assert violation.conflicting == ("file", "url")
+    assert results[3].error is None
+    assert results[4].violations == ()
+    assert results[4].error.startswith("No such option")
+
+    with pytest.raises(ValueError, match="'processes' must be a positive integer"):
+        validate_many(serialized_command, [], processes=0)
+
+
+def test_validate_many_usage_errors(runner, monkeypatch):
+    @click.command()
+    @click.argument("name")
+    @click.option("--n", type=int, default=1)
+    @click.option("--required", required=True, envvar="VALIDATE_MANY_REQUIRED")
+    @optgroup("Group", cls=RequiredAnyOptionGroup)
+    @optgroup.option("--a")
+    @optgroup.option("--b")
+    def cli(**params):
+        pass
+
+    argv_list = [
+        ["X", "--a", "1", "--required", "r"],
+        ["X", "--a", "1", "--required", "r", "--n", "abc"],
+        ["X", "--a", "1"],
+        ["--a", "1", "--required", "r"],
+        ["X", "--a", "1", "--required", "r", "extra"],
+        ["X", "--required", "r", "--n", "abc"],
+    ]
+
+    results = list(validate_many(cli, argv_list))
+
+    assert [result.ok for result in results] == [True, False, False, False, False, False]
+    assert [result.error for result in results] == [
+        None,
+        "Invalid value for '--n': 'abc' is not a valid integer.",
+        "Missing option '--required'.",
+        "Missing argument 'NAME'.",
+        "Got unexpected extra argument (extra)",
+        "Invalid value for '--n': 'abc' is not a valid integer.",
+    ]
+    assert [violation.kind for violation in results[5].violations] == ["required_any"]
+
+    for argv, result in zip(argv_list, results):
+        assert runner.invoke(cli, argv).exit_code == (0 if result.ok else 2)
+
+    @click.command()
+    @click.option("--name", prompt=True)
+    @click.option("--password", prompt=True, required=True)
+    @optgroup("Group")
+    @optgroup.option("--a", type=int)
+    def prompting_cli(**params):
+        pass
+
+    # The values of the prompt options are not prompted while validating
+    results = list(validate_many(prompting_cli, [["--password", "p"], ["--a", "x"], []]))
+    assert [result.error for result in results] == [
+        None,
+        "Invalid value for '--a': 'x' is not a valid integer.",
+        "Missing option '--password'.",
+    ]
+
+    # The required values are taken from the environment like by the command
+    monkeypatch.setenv("VALIDATE_MANY_REQUIRED", "r")
+    assert next(validate_many(cli, [["X", "--a", "1"]])).ok
+
+
+def test_validate_many_group_usage_errors(runner):
+    class NoBarOptionGroup(RequiredAnyOptionGroup):
+        def handle_parse_result(self, option, ctx, opts):
+            if option.name == "bar" and "bar" in opts:
+                msg = "'--bar' is not supported."
+                raise click.UsageError(msg, ctx=ctx)
+            super().handle_parse_result(option, ctx, opts)
+
+    class NoSpamOptionGroup(OptionGroup):
+        def validate(self, ctx, opts):
+            if "spam" in opts:
+                msg = "'--spam' is not supported."
+                raise click.UsageError(msg, ctx=ctx)
+
+    def make_cli(collect_errors):
+        @click.command()
+        @optgroup("Group 1", cls=NoBarOptionGroup)
+        @optgroup.option("--foo")
+        @optgroup.option("--bar")
+        @optgroup("Group 2", cls=NoSpamOptionGroup)
+        @optgroup.option("--spam")
+        def cli(**params):
+            pass
+
+        return optgroup.collect_errors()(cli) if collect_errors else cli
+
+    argv_list = [["--foo", "1"], ["--bar", "1"], ["--spam", "1"], ["--bar", "1", "--spam", "1"], []]
+    required_any = (
+        "Group 1",
+        "required_any",
+        "At least one of the following options from 'Group 1' option group is required:\n  '--foo'\n  '--bar'",
+    )
+    no_bar = ("Group 1", "usage_error", "'--bar' is not supported.")
+    no_spam = ("Group 2", "usage_error", "'--spam' is not supported.")
+
+    for collect_errors in (False, True):
+        cli = make_cli(collect_errors)
+        results = list(validate_many(cli, argv_list))
+
+        assert [[(v.group_name, v.kind, v.message) for v in result.violations] for result in results] == [
+            [],
+            [no_bar],
+            [required_any, no_spam],
+            [no_bar, no_spam],
+            [required_any],
+        ]
+
+        for argv, result in zip(argv_list, results):
+            assert runner.invoke(cli, argv).exit_code == (0 if result.ok else 2)
+
+    # The base method called by the overridden method collects the violations of all groups
+    result = runner.invoke(make_cli(collect_errors=True), ["--spam", "1"])
+    assert f"Error: {required_any[2]}\n'--spam' is not supported.\n" in result.output
+
+
+def test_option_group_violations(runner):
+    @click.command()
+    @optgroup("Group 1", cls=AllOptionGroup, constraints=[Implies("foo", "other")])
+    @optgroup.option("--foo")
+    @optgroup.option("--bar")
+    @optgroup.option("--spam")
+    @optgroup("Group 2", cls=MutuallyExclusiveOptionGroup, constraints=[AtLeast(1)])
+    @optgroup.option("--other")
+    @optgroup.option("--eggs")
+    def cli(**params):
+        pass
+
+    with pytest.raises(OptionGroupUsageError) as exc_info:
+        cli.main(["--foo", "1", "--bar", "2"], standalone_mode=False)
+
+    error = exc_info.value
+    [violation] = error.violations
+    assert isinstance(violation, OptionGroupViolation)
+    assert error.violation is violation
+    assert violation._message is None
+    assert (violation.group_name, violation.group_class, violation.kind) == ("Group 1", "AllOptionGroup", "all_or_none")
+    assert violation.option_names == ("foo", "bar", "spam")
+    assert violation.given == ("foo", "bar")
+    assert violation.missing == ("spam",)
+    assert violation.conflicting == ()
+    assert [param.name for param in violation.params] == ["foo", "bar", "spam"]
+    assert str(error) == violation.message
+
+    ctx = cli.make_context("cli", ["--foo", "1"], resilient_parsing=True)
+    opts = {"foo": "1"}
+    group1, group2 = (param.group for param in cli.params if param.name in ("foo", "other"))
+
+    violations = group1.get_violations(ctx, opts) + group2.get_violations(ctx, opts)
+    assert [(v.group_name, v.kind, v.missing) for v in violations] == [
+        ("Group 1", "all_or_none", ("bar", "spam")),
+        ("Group 1", "implies", ("other",)),
+        ("Group 2", "at_least", ("other", "eggs")),
+    ]
+
+    error = OptionGroupUsageError.from_violations(violations, ctx=ctx)
+    assert error.group is group1
+    assert error.format_message() == "\n".join(v.message for v in violations)
+
+    restored = pickle.loads(pickle.dumps(violations[1]))
+    assert restored.ctx is None
+    assert restored.params == ()
+    assert restored.message == violations[1].message
+    assert restored.to_dict() == violations[1].to_dict()
+
+
+@click.command()
+@optgroup.collect_errors()
+@optgroup("Group 3", cls=RequiredAllOptionGroup)
+@optgroup.option("--bar")
+@optgroup("Group 2", cls=MutuallyExclusiveOptionGroup)
+@optgroup.option("--eggs")
+@optgroup.option("--spam")
+@optgroup("Group 1", cls=RequiredAnyOptionGroup)
+@optgroup.option("--foo")
+def collecting_cli(**params):
+    click.echo("ok")
+
+
+@pytest.mark.parametrize("on_command", [False, True, "restored"])
+def test_collect_errors(runner, monkeypatch, on_command):
+    def cli(**params):
+        click.echo("ok")
+
+    cli = optgroup.option("--foo")(cli)
+    cli = optgroup.group("Group 1", cls=RequiredAnyOptionGroup)(cli)
+    cli = optgroup.option("--spam")(cli)
+    cli = optgroup.option("--eggs")(cli)
+    cli = optgroup.group("Group 2", cls=MutuallyExclusiveOptionGroup)(cli)
+    cli = optgroup.option("--bar")(cli)
+    cli = optgroup.group("Group 3", cls=RequiredAllOptionGroup)(cli)
+
+    if on_command == "restored":
+        file = io.BytesIO()
+        dump_command(collecting_cli, file)
+        file.seek(0)
+
+        # The callback of the command is restored as a lazy reference to the not imported module
+        with monkeypatch.context() as patch:
+            patch.delitem(sys.modules, __name__)
+            cli = load_command(file, check_sources=False)
+    elif on_command:
+        cli = optgroup.collect_errors()(click.command()(cli))
+    else:
+        cli = click.command()(optgroup.collect_errors()(cli))
+
+    with pytest.raises(OptionGroupUsageError) as exc_info:
+        cli.main(["--spam", "1", "--eggs", "2"], standalone_mode=False)
+
+    assert [(violation.group_name, violation.kind) for violation in exc_info.value.violations] == [
+        ("Group 3", "required_all"),
+        ("Group 2", "mutually_exclusive"),
+        ("Group 1", "required_any"),
+    ]
+
+    result = runner.invoke(cli, ["--spam", "1", "--eggs", "2"])
+    assert "Missing required options from 'Group 3' option group:\n  '--bar'\n" in result.output
+    assert "Mutually exclusive options from 'Group 2' option group cannot be used at the same time:" in result.output
+    assert "At least one of the following options from 'Group 1' option group is required:\n  '--foo'" in result.output
+
+    result = runner.invoke(cli, ["--foo", "1", "--bar", "2"])
+    assert not result.exception
+    assert result.output == "ok\n"
+
+
+def test_complete_options():
+    @click.command(cls=GroupedCommand)
+    @click.option("--hello", help="Hello option")
+    @optgroup("Group")
+    @optgroup.option("--foo", help="Foo option")
+    @optgroup.option("--bar/--no-bar")
+    @optgroup.option("--secret", hidden=True)
+    @optgroup.option("--multi", multiple=True)
+    @optgroup.group()
+    @optgroup.option("--spam", help="Spam option")
+    def cli(**params):
+        pass
+
+    ctx = cli.make_context("cli", ["--foo", "1", "--multi", "x"], resilient_parsing=True)
+
+    items = cli.shell_complete(ctx, "--")
+    assert [(item.value, item.help) for item in items] == [
+        ("--hello", "Hello option"),
+        ("--bar", "Group"),
+        ("--no-bar", "Group"),
+        ("--multi", "Group"),
+        ("--spam", "Spam option"),
+        ("--help", "Show this message and exit."),
+    ]
+    assert [item.value for item in items] == [item.value for item in click.Command.shell_complete(cli, ctx, "--")]
+    assert [item.value for item in complete_options(ctx, "--f")] == []
+    assert [item.value for item in cli.shell_complete(ctx, "--n")] == ["--no-bar"]
+
+    ctx = cli.make_context("cli", [], resilient_parsing=True)
+    assert [item.help for item in cli.shell_complete(ctx, "--f")] == ["Group: Foo option"]
+
+
+def test_complete_feature_switches():
+    @click.command(cls=GroupedCommand)
+    @optgroup("Transform")
+    @optgroup.option("--upper", "transform", flag_value="upper", default=True)
+    @optgroup.option("--lower", "transform", flag_value="lower")
+    def cli(transform):
+        pass
+
+    ctx = cli.make_context("cli", [], resilient_parsing=True)
+
+    items = cli.shell_complete(ctx, "--")
+    assert [item.value for item in items] == ["--upper", "--lower", "--help"]
+    assert [item.value for item in items] == [item.value for item in click.Command.shell_complete(cli, ctx, "--")]
+
+
+def test_grouped_group_completion():
+    @click.group(cls=GroupedGroup)
+    @optgroup("Group")
+    @optgroup.option("--foo")
+    def cli(**params):
+        pass
+
+    @cli.command()
+    @optgroup("Sub group")
+    @optgroup.option("--bar")
+    def sub(**params):
+        pass
+
+    assert isinstance(sub, GroupedCommand)
+
+    ctx = cli.make_context("cli", [], resilient_parsing=True)
+    assert [(item.value, item.help) for item in cli.shell_complete(ctx, "--")] == [
+        ("--foo", "Group"),
+        ("--help", "Show this message and exit."),
+    ]
+    assert [item.value for item in cli.shell_complete(ctx, "s")] == ["sub"]
+
+    sub_ctx = sub.make_context("sub", [], parent=ctx, resilient_parsing=True)
+    assert [item.value for item in sub.shell_complete(sub_ctx, "--b")] == ["--bar"]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not supported")
+def test_completion_daemon(tmp_path, monkeypatch):
+    source = textwrap.dedent(
+        """
+        import click
+        from click_option_group import optgroup, RequiredMutuallyExclusiveOptionGroup
+
+        @click.group()
+        def cli():
+            pass
+
+        @cli.command()
+        @optgroup("Group", cls=RequiredMutuallyExclusiveOptionGroup)
+        @optgroup.option("--foo")
+        @optgroup.option("--bar")
+        def sub(foo, bar):
+            pass
+        """
+    )
+    (tmp_path / "daemon_commands.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "daemon_commands", raising=False)
+
+    socket_path = tmp_path / "daemon.sock"
+    daemon = CompletionDaemon("daemon_commands:cli", check_interval=0)
+    thread = threading.Thread(target=daemon.serve_forever, args=(socket_path,))
+    thread.start()
+
+    try:
+        deadline = time.monotonic() + 10
+        while not socket_path.exists():
+            assert thread.is_alive(), "The daemon stopped before listening on the socket"
+            assert time.monotonic() < deadline, "The daemon did not listen on the socket in time"
+            time.sleep(0.01)
+
+        def complete(incomplete):
+            response = query_daemon(socket_path, {"action": "complete", "args": ["sub"], "incomplete": incomplete})
+            return [item["value"] for item in response["completions"]]
+
+        with ThreadPoolExecutor(4) as executor:
+            assert list(executor.map(complete, ["--f", "--b"] * 4)) == [["--foo"], ["--bar"]] * 4
+
+        response = query_daemon(socket_path, {"action": "validate", "args": ["sub", "--foo", "1", "--bar", "2"]})
+        assert not response["ok"]
+        assert response["violations"][0]["kind"] == "mutually_exclusive"
+        assert response["violations"][0]["conflicting"] == ["foo", "bar"]
+
+        response = query_daemon(socket_path, {"action": "validate", "args": ["sub", "--spam"]})
+        assert not response["ok"]
+        assert response["error"].startswith("No such option")
+
+        response = query_daemon(socket_path, {"action": "compile"})
+        assert response["failure"].startswith("ValueError: Unknown action")
+
+        (tmp_path / "daemon_commands.py").write_text(source.replace("--bar", "--bazz"))
+        assert complete("--b") == ["--bazz"]
+    finally:
+        daemon.shutdown()
+        thread.join(timeout=10)
+
+    assert not socket_path.exists()
+
+
+def test_option_group_storage():
+    @click.command()
+    @optgroup("Group", cls=RequiredAnyOptionGroup)
+    @optgroup.option("--foo")
+    @optgroup.option("--bar")
+    def cli(foo, bar):
+        pass
+
+    group = cli.params[0].group
+
+    assert not hasattr(group, "__dict__")
+    assert weakref.ref(group)() is group
+    assert pickle.loads(pickle.dumps(group)).name == "Group"
+
+    # The title options are registered once per decorated function for all groups
+    assert list(cli.callback.__click_option_group_titles__) == [group]
+
+
+def test_bound_method_callback(runner):
+    class App:
+        def run(self, foo, bar):
+            click.echo(f"{foo},{bar}")
+
+    # The bound methods do not accept new attributes
+    group = RequiredAnyOptionGroup("Group")
+    cli = click.Command("cli", callback=App().run)
+    cli = group.option("--foo")(cli)
+    cli = group.option("--bar")(cli)
+
+    assert [param.opts for param in cli.params] == [["--foo"], ["--bar"], []]
+
+    result = runner.invoke(cli, ["--foo", "1"])
+    assert not result.exception
+    assert result.output == "1,None\n"
+
+
+def test_grouped_command_validation(runner):
+    calls = []
+
+    class CountingOptionGroup(RequiredMutuallyExclusiveOptionGroup):
+        def validate(self, ctx, opts):
+            calls.append(self.name)
+            super().validate(ctx, opts)
+
+    def make_cli(cls):
+        @click.command(cls=cls)
+        @optgroup("Group 1", cls=CountingOptionGroup, help="Group 1 help")
+        @optgroup.option("--foo", type=int)
+        @optgroup.option("--bar")
+        @optgroup.group("Group 2", cls=AllOptionGroup)
+        @optgroup.option("--spam")
+        @optgroup.option("--ham")
+        @click.option("--egg", type=int)
+        def cli(**params):
+            click.echo(params)
+
+        return cli
+
+    cli = make_cli(GroupedCommand)
+    ctx = cli.make_context("cli", ["--foo", "1"])
+
+    # The title options are not parsed, the groups are validated after the other parameters
+    param_names = [param.name for param in cli.get_params(ctx)]
+    assert param_names[:5] == ["foo", "bar", "spam", "ham", "egg"]
+    assert param_names[-1] == "_option_groups_validation"
+    assert calls == ["Group 1"]
+
+    assert runner.invoke(cli, ["--help"]).output == runner.invoke(make_cli(click.Command), ["--help"]).output
+
+    for args in (["--foo", "1", "--bar", "2"], ["--foo", "1", "--spam", "3"], ["--bar", "2", "--egg", "x"], []):
+        result = runner.invoke(cli, args)
+        expected = runner.invoke(make_cli(click.Command), args)
+        assert result.exit_code == expected.exit_code == 2
+        assert result.output == expected.output
+
+    result = runner.invoke(cli, ["--foo", "1", "--spam", "3", "--ham", "4"])
+    assert not result.exception
+    assert "'foo': 1" in result.output
+
+
+def test_grouped_command_overridden_handle_parse_result(runner):
+    class NoBarOptionGroup(OptionGroup):
+        def handle_parse_result(self, option, ctx, opts):
+            if option.name == "bar" and "bar" in opts:
+                msg = "'--bar' is not supported."
+                raise click.UsageError(msg, ctx=ctx)
+
+    @click.command(cls=GroupedCommand)
+    @optgroup("Group", cls=NoBarOptionGroup)
+    @optgroup.option("--foo")
+    @optgroup.option("--bar")
+    def cli(**params):
+        click.echo(params)
+
+    # The overridden method is called for every option like by click.Command
+    result = runner.invoke(cli, ["--bar", "1"])
+    assert result.exit_code == 2
+    assert "'--bar' is not supported." in result.output
+
+    result = runner.invoke(cli, ["--foo", "1"])
+    assert not result.exception
+
+
+def test_import_time():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import click; import click_option_group"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # The lines of "-X importtime" are "import time: <self> | <cumulative> | <module>"
+    imported = [
+        line.rsplit("|", 1)[1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")
+    ]
+    imported = imported[imported.index("click") + 1 :]
+
+    # Only the modules for decorating and parsing are imported besides click
+    assert sorted(name for name in imported if name.startswith("click_option_group")) == [
+        "click_option_group",
+        "click_option_group._core",
+        "click_option_group._decorators",
+        "click_option_group._helpers",
+        "click_option_group._instrument",
+        "click_option_group._version",
+    ]
+
+    # The standard modules which are not imported by some click versions,
+    # "__future__" is imported by the generated `_version` module
+    cheap_modules = {
+        "__future__",
+        "collections",
+        "functools",
+        "importlib",
+        "itertools",
+        "threading",
+        "time",
+        "warnings",
+        "weakref",
+    }
+    assert {name for name in imported if not name.startswith("click_option_group")} <= cheap_modules
+
+
+def test_lazy_exports():
+    import click_option_group  # noqa: PLC0415
+
+    assert set(click_option_group.__all__) <= set(dir(click_option_group))
+
+    for name in click_option_group.__all__:
+        assert getattr(click_option_group, name) is not None
+
+    with pytest.raises(AttributeError, match="has no attribute 'spam'"):
+        _ = click_option_group.spam
+
+
+def test_build_groups(runner, monkeypatch):
+    @click.command()
+    @optgroup("Group 1", cls=RequiredAnyOptionGroup, help="Group 1 help")
+    @optgroup.option("--foo", help="Foo help")
+    @optgroup.option("--bar", type=int)
+    @optgroup.group("Group 2", cls=MutuallyExclusiveOptionGroup, constraints=[AtMost(1)])
+    @optgroup.option("--spam", is_flag=True)
+    @optgroup.option("--ham")
+    @optgroup.group("Hidden", hidden=True)
+    @optgroup.option("--secret")
+    @click.option("--egg")
+    def decorated(**params):
+        click.echo(params)
+
+    spec = [
+        {
+            "name": "Group 1",
+            "cls": "RequiredAnyOptionGroup",
+            "help": "Group 1 help",
+            "options": [{"param_decls": ["--foo"], "help": "Foo help"}, {"param_decls": ["--bar"], "type": int}],
+        },
+        {
+            "name": "Group 2",
+            "cls": MutuallyExclusiveOptionGroup,
+            "constraints": [AtMost(1)],
+            "options": [{"param_decls": ["--spam"], "is_flag": True}, {"param_decls": ["--ham"]}],
+        },
+        {"name": "Hidden", "hidden": True, "options": [{"param_decls": ["--secret"], "cls": "GroupedOption"}]},
+    ]
+
+    @click.option("--egg")
+    def callback(**params):
+        click.echo(params)
+
+    built = click.command("decorated")(build_groups(callback, spec))
+
+    def param_kinds(command):
+        return [(type(param).__name__, param.opts) for param in command.params]
+
+    assert param_kinds(built) == param_kinds(decorated)
+
+    for args in (["--help"], ["--foo", "1", "--bar", "2"], ["--spam", "--ham", "1"], ["--egg", "1"]):
+        assert runner.invoke(built, args).output == runner.invoke(decorated, args).output
+
+    # The options are added to the command like by the decorators applied to the command
+    command = build_groups(click.Command("cli", params=[click.Option(["--egg"])]), spec[:1])
+    expected = click.Command("cli", params=[click.Option(["--egg"])])
+    expected = optgroup.option("--bar", type=int)(expected)
+    expected = optgroup.option("--foo", help="Foo help")(expected)
+    expected = optgroup("Group 1", cls=RequiredAnyOptionGroup, help="Group 1 help")(expected)
+    assert param_kinds(command) == param_kinds(expected)
+
+    with pytest.warns(EmptyOptionGroupWarning, match='The empty option group "Empty"'):
+        build_groups(callback, [{"name": "Empty"}])
+
+    # The empty groups are reported according to `optgroup.empty_group_action`
+    with monkeypatch.context() as patch, warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        patch.setattr(optgroup, "empty_group_action", "ignore")
+        build_groups(callback, [{"name": "Empty"}])
+
+        patch.setattr(optgroup, "empty_group_action", "collect")
+        build_groups(callback, [{"name": "Empty"}])
+
+    assert caught == []
+    [empty_group_warning] = optgroup.pop_empty_group_warnings()
+    assert 'The empty option group "Empty"' in str(empty_group_warning.message)
+    assert empty_group_warning.filename == __file__
+
+    with pytest.raises(TypeError, match="must be a subclass of 'OptionGroup' class, got 'Spam'"):
+        build_groups(callback, [{"cls": "Spam", "options": [{"param_decls": ["--foo"]}]}])
+
+    with pytest.raises(TypeError, match="'required' attribute is not allowed"):
+        build_groups(callback, [{"cls": AllOptionGroup, "options": [{"param_decls": ["--foo"], "required": True}]}])